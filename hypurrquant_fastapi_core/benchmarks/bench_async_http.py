@@ -0,0 +1,176 @@
+"""
+async_http 오프라인 부하 테스트.
+
+    PROFILE=test python benchmarks/bench_async_http.py \
+        --requests 2000 --concurrency 50 --latency-ms 5 --error-rate 0.01
+
+별도 프로세스로 띄운 로컬 스텁 서버(stub_server.py)에 send_request
+(GET /data/market-data)와 send_request_for_external(POST /info)을 지정한
+동시성으로 보내고 처리량, p50/p95/p99 지연, 오류 유형, 메모리를 출력한다.
+TCPConnector 한도, 타임아웃, 재시도/hedge/병합 옵션을 바꿔 가며 비교하는 용도다.
+"""
+
+from hypurrquant_fastapi_core.api.async_http import (
+    close_session,
+    get_http_metrics,
+    send_request,
+    send_request_for_external,
+)
+from hypurrquant_fastapi_core.api.session_pool import SessionPoolConfig, session_pools
+from stub_server import add_stub_arguments, start_stub_process, stub_config_from_args
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import time
+import tracemalloc
+from collections import Counter
+
+
+def quantile(samples: list, q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def drive(scenario: str, base_url: str, args) -> dict:
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+    errors = Counter()
+
+    if scenario == "internal":
+
+        def make_call():
+            return send_request(
+                "GET",
+                f"{base_url}/data/market-data",
+                timeout=args.timeout,
+                coalesce=args.coalesce,
+                hedge=args.hedge,
+            )
+
+    else:
+
+        def make_call():
+            return send_request_for_external(
+                "POST",
+                f"{base_url}/info",
+                json={
+                    "type": "candleSnapshot",
+                    "req": {"coin": "BTC", "interval": "1m"},
+                },
+                timeout=args.timeout,
+                retry=not args.no_retry,
+                coalesce=args.coalesce,
+                bypass_cache=not args.cache,
+                hedge=args.hedge,
+            )
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await make_call()
+                latencies.append(time.perf_counter() - started)
+            except Exception as e:
+                errors[type(e).__name__] += 1
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if args.tracemalloc:
+        tracemalloc.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(args.requests)))
+    elapsed = time.perf_counter() - started
+    peak = None
+    if args.tracemalloc:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return {
+        "scenario": scenario,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "ok": len(latencies),
+        "errors": dict(errors),
+        "elapsed_s": elapsed,
+        "throughput_rps": args.requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1e3 if latencies else None,
+        "p95_ms": quantile(latencies, 0.95) * 1e3 if latencies else None,
+        "p99_ms": quantile(latencies, 0.99) * 1e3 if latencies else None,
+        "max_rss_kb": rss_after,
+        "max_rss_growth_kb": rss_after - rss_before,
+        "tracemalloc_peak_kb": peak / 1024 if peak is not None else None,
+    }
+
+
+def print_result(result: dict) -> None:
+    def fmt(value):
+        return "-" if value is None else f"{value:8.1f}"
+
+    print(
+        f"[{result['scenario']:<8}] ok={result['ok']}/{result['requests']} "
+        f"rps={result['throughput_rps']:8.1f} "
+        f"p50={fmt(result['p50_ms'])}ms p95={fmt(result['p95_ms'])}ms "
+        f"p99={fmt(result['p99_ms'])}ms "
+        f"rss={result['max_rss_kb'] / 1024:.1f}MiB "
+        f"(+{result['max_rss_growth_kb'] / 1024:.1f}) "
+        f"tracemalloc_peak={fmt(result['tracemalloc_peak_kb'])}KiB "
+        f"errors={result['errors']}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenario", choices=["internal", "external", "both"], default="both")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--timeout", type=int, default=10)
+    parser.add_argument("--port", type=int, default=18080)
+    # 클라이언트 튜닝 대상
+    parser.add_argument("--pool-limit", type=int, default=100)
+    parser.add_argument("--pool-limit-per-host", type=int, default=100)
+    parser.add_argument("--keepalive-timeout", type=float, default=30.0)
+    parser.add_argument("--connect-timeout", type=float, default=None)
+    parser.add_argument("--no-retry", action="store_true")
+    parser.add_argument("--coalesce", action="store_true")
+    parser.add_argument("--hedge", action="store_true")
+    parser.add_argument("--cache", action="store_true", help="/info 응답 캐시 사용")
+    parser.add_argument("--tracemalloc", action="store_true")
+    parser.add_argument("--json-out", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--show-metrics", action="store_true")
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    stub = start_stub_process(stub_config_from_args(args), args.port)
+    session_pools.register(
+        base_url,
+        SessionPoolConfig(
+            limit=args.pool_limit,
+            limit_per_host=args.pool_limit_per_host,
+            keepalive_timeout=args.keepalive_timeout,
+            connect_timeout=args.connect_timeout,
+        ),
+    )
+
+    scenarios = ["internal", "external"] if args.scenario == "both" else [args.scenario]
+    results = []
+    try:
+        for scenario in scenarios:
+            result = await drive(scenario, base_url, args)
+            print_result(result)
+            results.append(result)
+        if args.show_metrics:
+            print(json.dumps(get_http_metrics(), indent=2, default=str))
+    finally:
+        await close_session()
+        stub.terminate()
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+"""
+CANDLE_BY_TICKER_INTERVAL 값 → 캔들 데이터 변환 시간 비교 벤치마크.
+
+    PROFILE=test python benchmarks/bench_candle_decode.py [--bars 5000] [--repeat 200]
+
+Redis에서 받은 bytes를 CandleService가 쓰는 모양으로 만드는 시간만 측정한다(네트워크 제외).
+- json (legacy): 기존 fetch_candles 구현 (json.loads → DataFrame → rename → to_datetime → astype)
+- json (codec): JSON fallback 경로 (decode_json 사용)
+- binary frame: 바이너리 포맷 → DataFrame (OHLCV 블록 memcpy 1회, 수정 가능)
+- binary arrays: 바이너리 포맷 → numpy view만 (fetch_candle_arrays)
+"""
+
+from hypurrquant_fastapi_core.api.candle_codec import (
+    decode_candles,
+    encode_candles,
+    json_candles_to_frame,
+    payload_to_frame,
+)
+from stub_server import make_candles
+import argparse
+import json
+import statistics
+import time
+import pandas as pd
+
+
+def legacy_frame(payload: bytes) -> pd.DataFrame:
+    """기존 CandleService.fetch_candles의 변환 과정 재현 (비교용)."""
+    df = pd.DataFrame(json.loads(payload))
+    df.rename(
+        columns={
+            "t": "time",
+            "o": "open",
+            "h": "high",
+            "l": "low",
+            "c": "close",
+            "v": "volume",
+        },
+        inplace=True,
+    )
+    df["time"] = pd.to_datetime(df["time"], unit="ms")
+    df.set_index("time", inplace=True)
+    return df.astype(
+        {"open": float, "high": float, "low": float, "close": float, "volume": float}
+    )
+
+
+def measure(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    candles = make_candles(args.bars)
+    json_payload = json.dumps(candles).encode()
+    binary_payload = encode_candles(candles)
+
+    # 두 경로의 결과가 같은지 먼저 확인한다.
+    expected = legacy_frame(json_payload)
+    actual = payload_to_frame(binary_payload, "BTC", "1m")
+    pd.testing.assert_frame_equal(actual[expected.columns], expected)
+
+    print(
+        f"bars={args.bars} json={len(json_payload):,}B binary={len(binary_payload):,}B "
+        f"({len(binary_payload) / len(json_payload):.0%})"
+    )
+    cases = {
+        "json (legacy)": lambda: legacy_frame(json_payload),
+        "json (codec)": lambda: json_candles_to_frame(json_payload),
+        "binary frame": lambda: payload_to_frame(binary_payload, "BTC", "1m"),
+        "binary arrays": lambda: decode_candles(binary_payload),
+    }
+    baseline = None
+    for name, func in cases.items():
+        func()  # warm-up
+        ms = measure(func, args.repeat)
+        baseline = baseline or ms
+        print(f"{name:<15} {ms:9.3f} ms  x{baseline / ms:,.1f}")
+    print(f"encode (writer)  {measure(lambda: encode_candles(candles), args.repeat):9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+hedged request 지연 시간 벤치마크.
+
+    PROFILE=test python benchmarks/bench_hedging.py [--requests 1000] [--concurrency 20]
+
+꼬리 지연이 긴 로컬 /info 스텁(기본: 95%는 5~15ms, 5%는 300ms)에 같은 요청을
+hedge=False / hedge=True로 보내고 p50/p95/p99 지연과 hedge 통계를 비교한다.
+"""
+
+from hypurrquant_fastapi_core.api.async_http import (
+    close_session,
+    clear_response_cache,
+    get_hedge_stats,
+    send_request_for_external,
+)
+from aiohttp import web
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+
+def make_app(slow_ratio: float, slow_ms: float) -> web.Application:
+    async def info(request: web.Request) -> web.Response:
+        if random.random() < slow_ratio:
+            await asyncio.sleep(slow_ms / 1000)
+        else:
+            await asyncio.sleep(random.uniform(0.005, 0.015))
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_post("/info", info)
+    return app
+
+
+def quantile(samples: list, q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run(url: str, requests: int, concurrency: int, hedge: bool) -> list:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            # 캐시되지 않는 type을 사용해 매번 네트워크를 탄다.
+            await send_request_for_external(
+                "POST", url, json={"type": "benchHedge"}, hedge=hedge
+            )
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--slow-ratio", type=float, default=0.05)
+    parser.add_argument("--slow-ms", type=float, default=300)
+    parser.add_argument("--port", type=int, default=18090)
+    args = parser.parse_args()
+
+    runner = web.AppRunner(make_app(args.slow_ratio, args.slow_ms))
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", args.port).start()
+    url = f"http://127.0.0.1:{args.port}/info"
+
+    try:
+        for hedge in (False, True):
+            random.seed(0)
+            clear_response_cache()
+            started = time.perf_counter()
+            latencies = await run(url, args.requests, args.concurrency, hedge)
+            elapsed = time.perf_counter() - started
+            print(
+                f"hedge={str(hedge):<5} "
+                f"p50={statistics.median(latencies) * 1e3:7.1f}ms "
+                f"p95={quantile(latencies, 0.95) * 1e3:7.1f}ms "
+                f"p99={quantile(latencies, 0.99) * 1e3:7.1f}ms "
+                f"max={max(latencies) * 1e3:7.1f}ms "
+                f"rps={len(latencies) / elapsed:7.1f}"
+            )
+        print(get_hedge_stats())
+    finally:
+        await close_session()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+"""
+/data/market-data 응답 bytes → 객체 변환 시간 비교 벤치마크.
+
+    PROFILE=test python benchmarks/bench_json_decode.py [--rows 400] [--repeat 50]
+
+디코더(json/orjson/msgspec)별로 bytes → BaseResponse → List[MarketData] 전체 시간을 측정한다.
+"""
+
+from hypurrquant_fastapi_core.api.json_codec import DECODERS
+from hypurrquant_fastapi_core.models.market_data import MarketData
+from hypurrquant_fastapi_core.response import BaseResponse
+import argparse
+import json
+import random
+import statistics
+import time
+
+
+def make_market_data_row(i: int) -> dict:
+    price = random.uniform(0.0001, 50_000)
+    prev = price * random.uniform(0.8, 1.2)
+    return {
+        "prevDayPx": prev,
+        "dayNtlVlm": random.uniform(0, 5e7),
+        "markPx": price,
+        "midPx": price * random.uniform(0.999, 1.001),
+        "circulatingSupply": random.uniform(1e6, 1e10),
+        "coin": f"@{i}",
+        "totalSupply": random.uniform(1e6, 1e10),
+        "dayBaseVlm": random.uniform(0, 1e8),
+        "tokens": [i + 1, 0],
+        "name": f"@{i}",
+        "index_x": i,
+        "isCanonical_x": False,
+        "token": i + 1,
+        "Tname": f"TKN{i}",
+        "szDecimals": random.randint(0, 5),
+        "weiDecimals": 8,
+        "index_y": i + 1,
+        "tokenId": "0x" + "%032x" % random.getrandbits(128),
+        "isCanonical_y": False,
+        "evmContract": (
+            {
+                "address": "0x" + "%040x" % random.getrandbits(160),
+                "evm_extra_wei_decimals": 0,
+            }
+            if i % 3 == 0
+            else None
+        ),
+        "fullName": f"Token {i}" if i % 2 == 0 else None,
+        "MarketCap": random.uniform(1e5, 1e10),
+        "24hchange": price - prev,
+        "24hchange_pct": (price - prev) / prev * 100,
+        "sector": random.choice([None, "meme", "defi", "infra"]),
+    }
+
+
+def make_payload(rows: int) -> bytes:
+    body = {
+        "code": 200,
+        "data": [make_market_data_row(i) for i in range(rows)],
+        "message": None,
+        "error_message": None,
+    }
+    return json.dumps(body).encode()
+
+
+def bench(fn, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(0)
+    payload = make_payload(args.rows)
+    print(f"payload: {len(payload) / 1024:.1f} KiB, rows={args.rows}")
+    print(
+        f"{'decoder':<8} {'decode ms':>10} {'response ms':>12} "
+        f"{'models ms':>10} {'total ms':>10}"
+    )
+
+    for name, decoder in DECODERS.items():
+        decode_t, response_t, model_t = [], [], []
+
+        def run():
+            t0 = time.perf_counter()
+            body = decoder(payload)
+            t1 = time.perf_counter()
+            response = BaseResponse(**body)
+            t2 = time.perf_counter()
+            [MarketData(**row) for row in response.data]
+            t3 = time.perf_counter()
+            decode_t.append(t1 - t0)
+            response_t.append(t2 - t1)
+            model_t.append(t3 - t2)
+
+        total = bench(run, args.repeat)
+        print(
+            f"{name:<8} "
+            f"{statistics.median(decode_t) * 1e3:>10.3f} "
+            f"{statistics.median(response_t) * 1e3:>12.3f} "
+            f"{statistics.median(model_t) * 1e3:>10.3f} "
+            f"{statistics.median(total) * 1e3:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
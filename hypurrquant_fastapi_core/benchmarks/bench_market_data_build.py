@@ -0,0 +1,81 @@
+"""
+HyqFetch.build_data 갱신 비용 벤치마크.
+
+    PROFILE=test python benchmarks/bench_market_data_build.py --rows 400 --builds 200
+
+스텁 서버의 churn(요청마다 가격이 바뀌는 row 비율)을 바꿔 가며
+- full: 매번 이전 상태(ETag, row)를 버리고 전체를 다시 파싱 (기존 동작)
+- delta: ETag(304) + row 단위 diff로 바뀐 row만 다시 파싱
+의 build_data 1회 평균 시간을 비교한다. 스텁은 별도 프로세스이므로 cpu 값이
+이 프로세스(워커)가 갱신에 쓰는 CPU 시간이다.
+"""
+
+from hypurrquant_fastapi_core.api import market_data
+from hypurrquant_fastapi_core.api.async_http import close_session
+from hypurrquant_fastapi_core.api.market_data import HyqFetch
+from stub_server import StubConfig, start_stub_process
+from dataclasses import replace
+import argparse
+import asyncio
+import time
+
+
+async def measure(fetch, builds: int, full: bool) -> dict:
+    await fetch.build_data()  # 워밍업 (첫 빌드는 항상 전체 파싱)
+    before = dict(fetch.build_stats)
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    for _ in range(builds):
+        if full:
+            fetch._etag = None
+            fetch._snapshot = replace(fetch.snapshot, rows_by_coin={})
+        await fetch.build_data()
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+    return {
+        "ms_per_build": elapsed / builds * 1e3,
+        "cpu_ms_per_build": cpu / builds * 1e3,
+        "rows_parsed": fetch.build_stats["rows_parsed"] - before["rows_parsed"],
+        "not_modified": fetch.build_stats["not_modified"] - before["not_modified"],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=400)
+    parser.add_argument("--builds", type=int, default=200)
+    parser.add_argument("--port", type=int, default=18081)
+    parser.add_argument("--churn", type=float, nargs="+", default=[0.0, 0.05, 0.25, 1.0])
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    market_data.DATA_SERVER_URL = base_url
+    fetch = HyqFetch()
+
+    try:
+        for churn in args.churn:
+            for mode in ("full", "delta"):
+                stub = start_stub_process(
+                    StubConfig(latency_ms=0, jitter_ms=0, rows=args.rows, churn=churn),
+                    args.port,
+                )
+                try:
+                    fetch._etag = None
+                    fetch._snapshot = replace(fetch.snapshot, rows_by_coin={})
+                    result = await measure(fetch, args.builds, full=(mode == "full"))
+                finally:
+                    stub.terminate()
+                    stub.join()
+                print(
+                    f"churn={churn:<5} {mode:<5} "
+                    f"wall={result['ms_per_build']:7.3f} ms/build  "
+                    f"cpu={result['cpu_ms_per_build']:7.3f} ms/build  "
+                    f"rows_parsed={result['rows_parsed']:>7}  "
+                    f"not_modified={result['not_modified']}"
+                )
+    finally:
+        await close_session()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+"""
+HyqFetch 읽기 처리량 벤치마크 (갱신이 계속 도는 상태).
+
+    PROFILE=test python benchmarks/bench_market_data_snapshot.py --readers 4 --seconds 3
+
+reader 스레드들이 coin → MarketData → Tname → MarketData 조회와 coin_list를 반복하는 동안
+이벤트 루프에서는 build_data가 쉬지 않고 돈다(스텁 churn으로 매번 내용이 바뀜).
+- locked: 기존 구현처럼 호출마다 threading.RLock을 잡고 읽는다 (비교용 재현)
+- snapshot: 현재 구현 (스냅샷 참조 하나만 읽음, 락 없음)
+각 읽기에서 coin/Tname 인덱스가 같은 빌드에서 나왔는지도 확인한다.
+"""
+
+from hypurrquant_fastapi_core.api import market_data
+from hypurrquant_fastapi_core.api.async_http import close_session
+from hypurrquant_fastapi_core.api.market_data import HyqFetch
+from stub_server import StubConfig, start_stub_process
+import argparse
+import asyncio
+import threading
+import time
+
+
+class LockedReader:
+    """기존 HyqFetch의 읽기 경로(호출마다 RLock) 재현."""
+
+    def __init__(self, fetch):
+        self.fetch = fetch
+        self.lock = threading.RLock()
+
+    def read(self, coin: str) -> bool:
+        with self.lock:
+            data = self.fetch.snapshot.Tname_by_coin[coin]
+        with self.lock:
+            same = self.fetch.snapshot.coin_by_Tname[data.Tname]
+        with self.lock:
+            self.fetch.snapshot.coin_list
+        return data is same
+
+
+class SnapshotReader:
+    def __init__(self, fetch):
+        self.fetch = fetch
+
+    def read(self, coin: str) -> bool:
+        # 여러 인덱스를 읽을 때는 스냅샷을 한 번만 잡는다.
+        snapshot = self.fetch.snapshot
+        data = snapshot.Tname_by_coin[coin]
+        same = snapshot.coin_by_Tname[data.Tname]
+        snapshot.coin_list
+        return data is same
+
+
+def reader_loop(reader, coins, stop: threading.Event, result: list) -> None:
+    reads = inconsistent = 0
+    i = 0
+    while not stop.is_set():
+        if not reader.read(coins[i % len(coins)]):
+            inconsistent += 1
+        reads += 1
+        i += 1
+    result.append((reads, inconsistent))
+
+
+async def run(fetch, reader, readers: int, seconds: float) -> dict:
+    coins = list(fetch.snapshot.Tname_by_coin)
+    stop = threading.Event()
+    results: list = []
+    threads = [
+        threading.Thread(target=reader_loop, args=(reader, coins, stop, results))
+        for _ in range(readers)
+    ]
+    version = fetch.version
+    for thread in threads:
+        thread.start()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        await fetch.build_data()
+        await asyncio.sleep(0)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return {
+        "reads_per_sec": sum(r for r, _ in results) / seconds,
+        "inconsistent": sum(i for _, i in results),
+        "refreshes": fetch.version - version,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=400)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--churn", type=float, default=0.05)
+    parser.add_argument("--port", type=int, default=18082)
+    args = parser.parse_args()
+
+    market_data.DATA_SERVER_URL = f"http://127.0.0.1:{args.port}"
+    stub = start_stub_process(
+        StubConfig(latency_ms=0, jitter_ms=0, rows=args.rows, churn=args.churn),
+        args.port,
+    )
+    fetch = HyqFetch()
+    try:
+        await fetch.build_data()
+        for name, reader in (
+            ("locked", LockedReader(fetch)),
+            ("snapshot", SnapshotReader(fetch)),
+        ):
+            result = await run(fetch, reader, args.readers, args.seconds)
+            print(
+                f"{name:<8} reads/s={result['reads_per_sec']:>12,.0f}  "
+                f"refreshes={result['refreshes']:>4}  "
+                f"inconsistent={result['inconsistent']}"
+            )
+    finally:
+        await close_session()
+        stub.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
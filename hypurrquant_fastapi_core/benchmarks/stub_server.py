@@ -0,0 +1,243 @@
+"""
+데이터 서버 / Hyperliquid /info를 흉내 내는 오프라인 aiohttp 스텁 서버.
+
+    python benchmarks/stub_server.py --port 18080 --latency-ms 5 --error-rate 0.01
+
+- GET  /data/market-data : BaseResponse 형태의 spot market data (rows개).
+  요청마다 churn 비율의 row 가격이 바뀌며, ETag / If-None-Match(304)를 지원한다.
+- GET  /data/perp-market-data : BaseResponse 형태의 perp market data (rows개)
+- POST /info : candleSnapshot 형태의 캔들 리스트 (candles개)
+
+지연(기본 + jitter + 느린 꼬리), 5xx JSON 오류율, HTML 오류 페이지 비율,
+payload 크기를 설정할 수 있다.
+"""
+
+from aiohttp import web
+from dataclasses import dataclass, asdict
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+
+
+@dataclass
+class StubConfig:
+    latency_ms: float = 5.0  # 기본 지연
+    jitter_ms: float = 2.0  # 기본 지연에 더해지는 uniform(0, jitter)
+    slow_ratio: float = 0.0  # 느린 응답 비율
+    slow_ms: float = 300.0  # 느린 응답 지연
+    error_rate: float = 0.0  # 500 JSON 응답 비율
+    html_error_rate: float = 0.0  # 502 text/html 응답 비율
+    rows: int = 400  # market-data row 수
+    candles: int = 500  # /info candleSnapshot 캔들 수
+    churn: float = 0.0  # market-data 요청마다 가격이 바뀌는 row 비율
+    seed: int = 0
+
+
+def make_market_data_rows(rows: int) -> list:
+    data = []
+    for i in range(rows):
+        price = random.uniform(0.0001, 50_000)
+        prev = price * random.uniform(0.8, 1.2)
+        data.append(
+            {
+                "prevDayPx": prev,
+                "dayNtlVlm": random.uniform(0, 5e7),
+                "markPx": price,
+                "midPx": price,
+                "circulatingSupply": random.uniform(1e6, 1e10),
+                "coin": f"@{i}",
+                "totalSupply": random.uniform(1e6, 1e10),
+                "dayBaseVlm": random.uniform(0, 1e8),
+                "tokens": [i + 1, 0],
+                "name": f"@{i}",
+                "index_x": i,
+                "isCanonical_x": False,
+                "token": i + 1,
+                "Tname": f"TKN{i}",
+                "szDecimals": 2,
+                "weiDecimals": 8,
+                "index_y": i + 1,
+                "tokenId": "0x" + "%032x" % random.getrandbits(128),
+                "isCanonical_y": False,
+                "evmContract": (
+                    {
+                        "address": "0x" + "%040x" % random.getrandbits(160),
+                        "evm_extra_wei_decimals": 0,
+                    }
+                    if i % 3 == 0
+                    else None
+                ),
+                "fullName": f"Token {i}",
+                "MarketCap": random.uniform(1e5, 1e10),
+                "24hchange": price - prev,
+                "24hchange_pct": (price - prev) / prev * 100,
+                "sector": ("defi", "meme", "ai", None)[i % 4],
+            }
+        )
+    return data
+
+
+def make_perp_rows(rows: int) -> dict:
+    data = {}
+    for i in range(rows):
+        price = random.uniform(0.01, 100_000)
+        data[f"PERP{i}"] = {
+            "szDecimals": 3,
+            "name": f"PERP{i}",
+            "maxLeverage": random.choice([3, 5, 10, 20, 40, 50]),
+            "funding": random.uniform(-0.0005, 0.0005),
+            "openInterest": random.uniform(0, 1e6),
+            "prevDayPx": price * random.uniform(0.9, 1.1),
+            "dayNtlVlm": random.uniform(0, 1e9),
+            "premium": random.uniform(-0.001, 0.001),
+            "oraclePx": price,
+            "markPx": price,
+            "midPx": price,
+            "impactPxs": [price * 0.9995, price * 1.0005],
+            "dayBaseVlm": random.uniform(0, 1e6),
+        }
+    return data
+
+
+def make_candles(count: int) -> list:
+    start = 1_700_000_000_000
+    price = 100.0
+    candles = []
+    for i in range(count):
+        o = price
+        c = price * random.uniform(0.99, 1.01)
+        candles.append(
+            {
+                "t": start + i * 60_000,
+                "T": start + (i + 1) * 60_000 - 1,
+                "s": "BTC",
+                "i": "1m",
+                "o": f"{o:.4f}",
+                "c": f"{c:.4f}",
+                "h": f"{max(o, c) * 1.002:.4f}",
+                "l": f"{min(o, c) * 0.998:.4f}",
+                "v": f"{random.uniform(0, 100):.4f}",
+                "n": random.randint(1, 500),
+            }
+        )
+        price = c
+    return candles
+
+
+def make_app(config: StubConfig) -> web.Application:
+    rng = random.Random(config.seed)
+    random.seed(config.seed)
+    market_rows = make_market_data_rows(config.rows)
+    market_state = {
+        "version": 0,
+        "body": json.dumps({"code": 200, "data": market_rows}).encode(),
+    }
+    perp_market_data = json.dumps(
+        {"code": 200, "data": make_perp_rows(config.rows)}
+    ).encode()
+    candles = json.dumps(make_candles(config.candles)).encode()
+
+    async def respond(body: bytes, headers=None) -> web.Response:
+        delay = config.latency_ms + rng.uniform(0, config.jitter_ms)
+        if rng.random() < config.slow_ratio:
+            delay = config.slow_ms
+        await asyncio.sleep(delay / 1000)
+
+        roll = rng.random()
+        if roll < config.html_error_rate:
+            return web.Response(
+                status=502,
+                text="<html><body><h1>502 Bad Gateway</h1></body></html>",
+                content_type="text/html",
+            )
+        if roll < config.html_error_rate + config.error_rate:
+            return web.json_response(
+                {"code": 9999, "message": "stub error"}, status=500
+            )
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    def churn_market_data() -> None:
+        changed = int(config.churn * len(market_rows))
+        if not changed:
+            return
+        for row in rng.sample(market_rows, changed):
+            row["midPx"] = row["markPx"] = row["markPx"] * rng.uniform(0.99, 1.01)
+        market_state["version"] += 1
+        market_state["body"] = json.dumps({"code": 200, "data": market_rows}).encode()
+
+    async def get_market_data(request: web.Request) -> web.Response:
+        churn_market_data()
+        etag = f'"{market_state["version"]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return await respond(market_state["body"], headers={"ETag": etag})
+
+    async def get_perp_market_data(request: web.Request) -> web.Response:
+        return await respond(perp_market_data)
+
+    async def post_info(request: web.Request) -> web.Response:
+        await request.read()
+        return await respond(candles)
+
+    app = web.Application()
+    app.router.add_get("/data/market-data", get_market_data)
+    app.router.add_get("/data/perp-market-data", get_perp_market_data)
+    app.router.add_post("/info", post_info)
+    return app
+
+
+async def start_stub(config: StubConfig, port: int) -> web.AppRunner:
+    """현재 이벤트 루프에서 스텁을 띄운다. 종료는 runner.cleanup()."""
+    runner = web.AppRunner(make_app(config), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner
+
+
+def _serve_forever(config: StubConfig, port: int, ready) -> None:
+    async def serve():
+        await start_stub(config, port)
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+def start_stub_process(config: StubConfig, port: int) -> multiprocessing.Process:
+    """
+    별도 프로세스에서 스텁을 띄운다. 클라이언트와 CPU를 나눠 쓰지 않아
+    측정값이 덜 왜곡된다. 종료는 process.terminate().
+    """
+    ready = multiprocessing.Event()
+    process = multiprocessing.Process(
+        target=_serve_forever, args=(config, port, ready), daemon=True
+    )
+    process.start()
+    if not ready.wait(timeout=30):
+        process.terminate()
+        raise RuntimeError("stub server did not start")
+    return process
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = StubConfig()
+    for name, value in asdict(defaults).items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}", type=type(value), default=value
+        )
+
+
+def stub_config_from_args(args: argparse.Namespace) -> StubConfig:
+    return StubConfig(**{name: getattr(args, name) for name in asdict(StubConfig())})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=18080)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+    config = stub_config_from_args(args)
+    print(f"stub server on http://127.0.0.1:{args.port} {config}")
+    web.run_app(make_app(config), host="127.0.0.1", port=args.port, access_log=None)
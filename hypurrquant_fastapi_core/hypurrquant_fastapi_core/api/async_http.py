@@ -1,71 +1,62 @@
 from hypurrquant_fastapi_core.logging_config import configure_logging, coroutine_id
 from hypurrquant_fastapi_core.response import BaseResponse
 from hypurrquant_fastapi_core.api.exception import get_exception_by_code
+from hypurrquant_fastapi_core.api.session_pool import session_pools, get_pool_stats
+from hypurrquant_fastapi_core.api.circuit_breaker import (
+    circuit_breakers,
+    get_circuit_states,
+)
+from hypurrquant_fastapi_core.api.retry_budget import (
+    budgeted_retry,
+    get_retry_stats,
+    parse_retry_after,
+)
+from hypurrquant_fastapi_core.api.hedging import get_hedge_stats, hedge_policy
+from hypurrquant_fastapi_core.api.http_metrics import endpoint_key, http_metrics
+from hypurrquant_fastapi_core.api.single_flight import SingleFlight, make_request_key
+from hypurrquant_fastapi_core.api.json_codec import decode_json
+from hypurrquant_fastapi_core.api.response_cache import (
+    ResponseCache,
+    served_from_cache,
+)
+from hypurrquant_fastapi_core.rate_limited import (
+    AsyncRateLimiter,
+    _default_async_limiter,
+)
 from hypurrquant_fastapi_core.exception import (
     BaseOrderException,
     UnhandledErrorException,
     NonJsonResponseIgnoredException,
 )
 import aiohttp
-from aiohttp import ClientSession, TCPConnector
 import asyncio
-from typing import Any, Dict, Optional
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
+import functools
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional, Sequence
 
 logger = configure_logging(__name__)
 
-import asyncio
-
-# 전역 카운터 & 락
-_consecutive_html_count = 0
-_html_count_lock = asyncio.Lock()
-
-_session: aiohttp.ClientSession | None = None
-
-
-def get_session() -> aiohttp.ClientSession:
-    global _session
-    if _session is None or _session.closed:
-        connector = TCPConnector(
-            limit=200,  # 최대 동시 커넥션
-            limit_per_host=50,  # 호스트당 최대
-            keepalive_timeout=30.0,  # 30초 유휴 후 커넥션 닫기
-            enable_cleanup_closed=True,  # 닫힌 커넥션 자동 정리
-        )
-        _session = ClientSession(connector=connector)
-    return _session
+# 동일 요청 병합 (coalesce=True로 호출한 요청에만 적용)
+_single_flight = SingleFlight()
 
+# 내부 서비스 앞단(로드밸런서 등)이 주는 상태 코드. 본문과 관계없이 호스트 장애로 기록한다.
+GATEWAY_STATUSES = (502, 504)
 
-async def close_session():
-    global _session
-    if _session and not _session.closed:
-        await _session.close()
-        _session = None
+# 멱등 /info 조회 응답 캐시 (request type별 TTL)
+_response_cache = ResponseCache()
 
 
-async def _increment_html_counter_and_maybe_raise():
+def get_session(url: Optional[str] = None) -> aiohttp.ClientSession:
     """
-    text/html 응답이 올 때마다 카운터를 올리고,
-    5회 연속이면 예외를 던짐.
+    url이 주어지면 해당 base URL 전용 풀의 세션을, 없으면 공용 풀의 세션을 반환한다.
     """
-    global _consecutive_html_count
-    async with _html_count_lock:
-        _consecutive_html_count += 1
-        if _consecutive_html_count >= 5:
-            # 5회째에만 예외 발생
-            _consecutive_html_count = 0
-            raise Exception("5번 연속으로 비(非)JSON(text/html) 응답을 받았습니다.")
+    if url is None:
+        return session_pools.default_pool().get_session()
+    return session_pools.get_pool(url).get_session()
 
 
-def _reset_html_counter():
-    """JSON 응답이 오면 카운터 초기화"""
-    global _consecutive_html_count
-    _consecutive_html_count = 0
+async def close_session():
+    await session_pools.close_all()
 
 
 def log_request_error(
@@ -91,20 +82,24 @@ def log_request_error(
     logger.info(log_msg, exc_info=True)
 
 
-@retry(
-    reraise=True,
-    stop=stop_after_attempt(3),  # 최대 3회 시도
-    wait=wait_exponential(multiplier=0.5, min=0.5),  # 0.5s → 1s → 2s …
-    retry=retry_if_exception_type(  # 재시도 대상 예외
-        (
-            aiohttp.ClientConnectionError,
-            aiohttp.ClientResponseError,
-            asyncio.TimeoutError,
-            NonJsonResponseIgnoredException,
-        )
+def _record_retry(
+    method, url, headers=None, params=None, data=None, json=None, *args, **kwargs
+):
+    """budgeted_retry 훅: 엔드포인트별 재시도 횟수를 기록한다."""
+    http_metrics.record_retry(url, json)
+
+
+@budgeted_retry(
+    max_attempts=3,  # 최대 3회 시도
+    retry_on=(  # 재시도 대상 예외
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientResponseError,
+        asyncio.TimeoutError,
+        NonJsonResponseIgnoredException,
     ),
+    on_retry=_record_retry,
 )
-async def send_request(
+async def _send_request(
     method: str,
     url: str,
     headers: Optional[Dict[str, str]] = None,
@@ -113,43 +108,73 @@ async def send_request(
     json: Optional[Dict[str, Any]] = None,
     timeout: int = 10,
 ) -> BaseResponse:
-    session = get_session()
+    pool = session_pools.get_pool(url)
+    breaker = circuit_breakers.for_url(url)
+    breaker.before_call()  # 서킷이 열려 있으면 재시도 없이 즉시 실패
     cid = coroutine_id.get()
     headers = headers.copy() if headers else {}
     headers.setdefault("X-Coroutine-ID", cid)
+    tracker = http_metrics.track(url, json)
     try:
-        async with session.request(
+        async with pool.acquire() as session, session.request(
             method=method,
             url=url,
             headers=headers,
             params=params,
             data=data,
             json=json,
-            timeout=aiohttp.ClientTimeout(total=timeout),
+            timeout=pool.timeout(timeout),
         ) as response:
+            tracker.set_response(response)
+
+            # 0) If-None-Match 조건부 요청에 대한 304: 본문 없이 data=None으로 반환
+            if response.status == 304:
+                breaker.record_success()
+                result = BaseResponse.model_construct(code=304, data=None)
+                result._etag = response.headers.get("ETag")
+                return result
 
             # 1) Content-Type 검사
             content_type = response.headers.get("Content-Type", "")
-            if (
-                "application/json" not in content_type
-            ):  # TODO 추후에 count 조건을 변경해야할 수도 있음. 예를 들어서 다른 500번대 에러
-                # JSON이 아니면 카운터 올리고 5회 연속 시 예외
-                await _increment_html_counter_and_maybe_raise()
-                # 5회 미만인 동안엔 그냥 로그만 찍고 끝냄
+            if "application/json" not in content_type:
+                # JSON이 아니면 서킷 브레이커에 실패로 기록 (연속 실패 시 서킷 open)
+                breaker.record_failure("non_json")
                 body = await response.text()
+                tracker.bytes_in = len(body)
                 logger.info(
-                    f"Non-JSON response ignored (count<{_consecutive_html_count}>): "
-                    f"status={response.status}, content-type={content_type}, body={body[:200]} count={_consecutive_html_count}"
+                    f"Non-JSON response ignored: status={response.status}, "
+                    f"content-type={content_type}, body={body[:200]}"
                 )
-                raise NonJsonResponseIgnoredException("비정상적인 응답입니다.")
-
-            # 2) JSON 응답이면 카운터 리셋
-            _reset_html_counter()
+                exc = NonJsonResponseIgnoredException("비정상적인 응답입니다.")
+                # 429/503의 Retry-After는 재시도 대기 시간으로 사용된다.
+                exc.retry_after = parse_retry_after(
+                    response.headers.get("Retry-After")
+                )
+                raise exc
 
-            # 3) HTTP 오류 상태코드(4xx/5xx) 처리
+            # 2) HTTP 오류 상태코드(4xx/5xx) 처리
             if response.status >= 400:
-                response_body = await response.json()
-                code = response_body.get("code")
+                raw = await response.read()
+                tracker.bytes_in = len(raw)
+                try:
+                    response_body = decode_json(raw)
+                except ValueError:
+                    response_body = None
+                code = (
+                    response_body.get("code")
+                    if isinstance(response_body, dict)
+                    else None
+                )
+
+                # code가 있는 JSON 오류는 서비스가 직접 만든 응답이므로 호스트는 정상으로 기록한다.
+                # (예: 그 서비스의 하위 서킷이 열려서 준 503 CircuitOpenException은 이 호스트의
+                # 장애가 아니므로, 실패로 세면 서킷 open이 호출한 쪽으로 번진다)
+                if response.status in GATEWAY_STATUSES or (
+                    response.status >= 500 and code is None
+                ):
+                    breaker.record_failure(f"status_{response.status}")
+                else:
+                    breaker.record_success()
 
                 if code is None:
                     raise UnhandledErrorException(
@@ -159,17 +184,24 @@ async def send_request(
                 message = response_body.get("message", "알 수 없는 오류")
                 raise BaseOrderException(message, code, status_code=response.status)
 
-            # 4) 정상 JSON 파싱
-            response_body = await response.json()
-            return BaseResponse(**response_body)
+            # 3) 정상 JSON 파싱
+            breaker.record_success()
+            raw = await response.read()
+            tracker.bytes_in = len(raw)
+            response_body = decode_json(raw)
+            result = BaseResponse(**response_body)
+            result._etag = response.headers.get("ETag")
+            return result
 
     # 이하 기존 예외 핸들러 유지...
     except aiohttp.ClientConnectionError as e:
+        breaker.record_failure("connection")
         logger.error("연결 오류 발생: 서버와의 연결에 실패했습니다.", exc_info=True)
         log_request_error(method, url, headers, params, data, json, e)
         raise e
 
     except asyncio.TimeoutError as e:
+        breaker.record_failure("timeout")
         logger.error("타임아웃 오류 발생: 요청 시간이 초과되었습니다.", exc_info=True)
         log_request_error(method, url, headers, params, data, json, e)
         raise e
@@ -183,6 +215,47 @@ async def send_request(
         log_request_error(method, url, headers, params, data, json, e)
         raise e
 
+    finally:
+        tracker.finish()
+
+
+async def send_request(
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, str]] = None,
+    data: Optional[Any] = None,
+    json: Optional[Dict[str, Any]] = None,
+    timeout: int = 10,
+    coalesce: bool = False,
+    hedge: bool = False,
+) -> BaseResponse:
+    """
+    내부 서버에 비동기 HTTP 요청을 보내는 함수.
+
+    Args:
+        coalesce (bool): True면 동시에 진행 중인 동일 요청(method, URL,
+            params, JSON body 기준)과 upstream 호출 및 결과를 공유한다.
+            멱등한 조회 요청에만 사용해야 하며, 반환된 객체는 수정하면 안 된다.
+        hedge (bool): True면 엔드포인트 p95 안에 응답이 없을 때 같은 요청을
+            한 번 더 보내고 먼저 온 응답을 사용한다. 멱등한 조회 요청에만 사용해야 한다.
+
+    응답의 ETag 헤더는 반환값의 etag로 볼 수 있다. headers에 If-None-Match를 넣어
+    보냈을 때 서버가 304를 주면 code=304, data=None인 응답을 반환한다.
+    """
+    call = functools.partial(
+        _send_request, method, url, headers, params, data, json, timeout
+    )
+    if hedge:
+        call = functools.partial(
+            hedge_policy.run, url, endpoint_key(url, json), call
+        )
+    if coalesce:
+        key = make_request_key(method, url, headers, params, data, json)
+        if key is not None:
+            return await _single_flight.do(key, call)
+    return await call()
+
 
 async def _send_request_for_external(
     method: str,
@@ -192,6 +265,8 @@ async def _send_request_for_external(
     data: Optional[Any] = None,
     json: Optional[Dict[str, Any]] = None,
     timeout: int = 10,
+    cache_key: Optional[Hashable] = None,
+    cache_ttl: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     비동기 HTTP 요청을 보내는 재사용 가능한 함수.
@@ -204,35 +279,53 @@ async def _send_request_for_external(
         data (Optional[Any]): 요청 바디 (form data 등).
         json (Optional[Dict[str, Any]]): 요청 바디 (JSON 데이터).
         timeout (int): 요청 타임아웃 (초 단위).
+        cache_key (Optional[Hashable]): 지정하면 파싱한 응답을 응답 캐시에 저장한다.
+        cache_ttl (Optional[float]): 응답 캐시 TTL (초 단위).
 
     Returns:
         Dict[str, Any]: JSON 응답 데이터.
     """
-    session = get_session()
+    pool = session_pools.get_pool(url)
+    breaker = circuit_breakers.for_url(url)
+    breaker.before_call()  # 서킷이 열려 있으면 재시도 없이 즉시 실패
+    tracker = http_metrics.track(url, json)
     try:
-        async with session.request(
+        async with pool.acquire() as session, session.request(
             method=method,
             url=url,
             headers=headers,
             params=params,
             data=data,
             json=json,
-            timeout=aiohttp.ClientTimeout(total=timeout),
+            timeout=pool.timeout(timeout),
         ) as response:
+            tracker.set_response(response)
+            if response.status >= 500:
+                breaker.record_failure(f"status_{response.status}")
             response.raise_for_status()
             content_length = response.headers.get("Content-Length")
             if response.status == 204 or str(content_length) == "0":
+                breaker.record_success()
                 return {}
 
             # 3) Content-Type 확인 (application/json이 아니면 빈 dict)
             content_type = response.headers.get("Content-Type", "")
             if "application/json" not in content_type:
+                breaker.record_failure("non_json")
                 return {}
 
+            breaker.record_success()
+
             # 4) 그 외에만 JSON 파싱
-            return await response.json()
+            body = await response.read()
+            tracker.bytes_in = len(body)
+            result = decode_json(body)
+            if cache_key is not None and cache_ttl:
+                _response_cache.set(cache_key, result, cache_ttl, len(body))
+            return result
 
     except aiohttp.ClientConnectionError as e:
+        breaker.record_failure("connection")
         logger.error("연결 오류 발생: 서버와의 연결에 실패했습니다.", exc_info=True)
         log_request_error(method, url, headers, params, data, json, e)
         raise e
@@ -241,6 +334,7 @@ async def _send_request_for_external(
         log_request_error(method, url, headers, params, data, json, e)
         raise e
     except aiohttp.ClientPayloadError as e:
+        breaker.record_failure("payload")
         logger.error(
             "페이로드 오류 발생: 응답 페이로드 처리 중 문제가 발생했습니다.",
             exc_info=True,
@@ -248,6 +342,7 @@ async def _send_request_for_external(
         log_request_error(method, url, headers, params, data, json, e)
         raise e
     except asyncio.TimeoutError as e:
+        breaker.record_failure("timeout")
         logger.error("타임아웃 오류 발생: 요청 시간이 초과되었습니다.", exc_info=True)
         log_request_error(method, url, headers, params, data, json, e)
         raise e
@@ -259,19 +354,18 @@ async def _send_request_for_external(
         logger.error(f"예상치 못한 오류 발생: {str(e)}", exc_info=True)
         log_request_error(method, url, headers, params, data, json, e)
         raise e
+    finally:
+        tracker.finish()
 
 
-@retry(
-    reraise=True,
-    stop=stop_after_attempt(5),  # 최대 5회 재시도
-    wait=wait_exponential(multiplier=0.5, min=0.5),  # 0.5s → 1s → 2s → …
-    retry=retry_if_exception_type(
-        (
-            aiohttp.ClientConnectionError,
-            aiohttp.ClientResponseError,
-            asyncio.TimeoutError,
-        )
+@budgeted_retry(
+    max_attempts=5,  # 최대 5회 시도
+    retry_on=(
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientResponseError,
+        asyncio.TimeoutError,
     ),
+    on_retry=_record_retry,
 )
 async def _send_request_for_external_retry(
     method: str,
@@ -281,6 +375,8 @@ async def _send_request_for_external_retry(
     data: Optional[Any] = None,
     json: Optional[Dict[str, Any]] = None,
     timeout: int = 10,
+    cache_key: Optional[Hashable] = None,
+    cache_ttl: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     외부 API에 비동기 HTTP 요청을 보내는 함수.
@@ -298,7 +394,15 @@ async def _send_request_for_external_retry(
         Dict[str, Any]: JSON 응답 데이터.
     """
     return await _send_request_for_external(
-        method, url, headers, params, data, json, timeout
+        method,
+        url,
+        headers,
+        params,
+        data,
+        json,
+        timeout,
+        cache_key=cache_key,
+        cache_ttl=cache_ttl,
     )
 
 
@@ -311,6 +415,9 @@ async def send_request_for_external(
     json: Optional[Dict[str, Any]] = None,
     timeout: int = 10,
     retry: bool = True,
+    coalesce: bool = False,
+    bypass_cache: bool = False,
+    hedge: bool = False,
 ) -> Dict[str, Any]:
     """
     외부 API에 비동기 HTTP 요청을 보내는 함수.
@@ -323,15 +430,215 @@ async def send_request_for_external(
         data (Optional[Any]): 요청 바디 (form data 등).
         json (Optional[Dict[str, Any]]): 요청 바디 (JSON 데이터).
         timeout (int): 요청 타임아웃 (초 단위).
+        retry (bool): 실패 시 재시도 여부.
+        coalesce (bool): True면 동시에 진행 중인 동일 요청과 결과를 공유한다.
+            /info 조회처럼 멱등한 요청에만 사용해야 한다.
+        bypass_cache (bool): True면 응답 캐시를 조회하지 않는다(응답은 다시 저장됨).
+            INFO_CACHE_TTLS에 등록된 type의 POST 요청만 캐싱 대상이다.
+        hedge (bool): True면 엔드포인트(/info는 type별) p95 안에 응답이 없을 때
+            같은 요청을 한 번 더 보내고 먼저 온 응답을 사용한다.
 
     Returns:
-        Dict[str, Any]: JSON 응답 데이터.
+        Dict[str, Any]: JSON 응답 데이터. 캐시/병합된 결과는 공유되므로 수정하면 안 된다.
     """
-    if retry:
-        return await _send_request_for_external_retry(
-            method, url, headers, params, data, json, timeout
+    cache_ttl = (
+        _response_cache.ttl_for(json) if method.upper() == "POST" else None
+    )
+    key = None
+    if coalesce or cache_ttl:
+        key = make_request_key(method, url, headers, params, data, json)
+    if key is None:
+        cache_ttl = None
+
+    if cache_ttl and not bypass_cache:
+        hit, cached = _response_cache.get(key)
+        if hit:
+            served_from_cache.set(True)
+            return cached
+    served_from_cache.set(False)
+
+    fn = _send_request_for_external_retry if retry else _send_request_for_external
+    call = functools.partial(
+        fn,
+        method,
+        url,
+        headers,
+        params,
+        data,
+        json,
+        timeout,
+        cache_key=key if cache_ttl else None,
+        cache_ttl=cache_ttl,
+    )
+    if hedge:
+        call = functools.partial(
+            hedge_policy.run, url, endpoint_key(url, json), call
         )
-    else:
-        return await _send_request_for_external(
-            method, url, headers, params, data, json, timeout
+    if coalesce and key is not None:
+        return await _single_flight.do(key, call)
+    return await call()
+
+
+@dataclass
+class RequestSpec:
+    """
+    send_many로 보낼 요청 하나의 명세.
+
+    external=True면 send_request_for_external, False면 send_request로 보낸다.
+    options는 해당 함수의 추가 키워드 인자(retry, coalesce, hedge 등)로 전달된다.
+    weight는 AsyncRateLimiter에 기록할 Hyperliquid rate limit weight이며,
+    external=True인 요청에만 적용된다(응답 캐시에서 응답된 요청은 기록하지 않음).
+    """
+
+    method: str
+    url: str
+    headers: Optional[Dict[str, str]] = None
+    params: Optional[Dict[str, str]] = None
+    data: Optional[Any] = None
+    json: Optional[Dict[str, Any]] = None
+    timeout: int = 10
+    weight: float = 1
+    external: bool = True
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchResult:
+    index: int  # specs 내 위치
+    spec: RequestSpec
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def _send_spec(
+    index: int,
+    spec: RequestSpec,
+    semaphore: asyncio.Semaphore,
+    limiter: Optional[AsyncRateLimiter],
+    min_quota: float,
+) -> BatchResult:
+    args = (
+        spec.method,
+        spec.url,
+        spec.headers,
+        spec.params,
+        spec.data,
+        spec.json,
+        spec.timeout,
+    )
+    async with semaphore:
+        try:
+            if not spec.external:
+                # 내부 서버 요청은 Hyperliquid rate limit과 무관하다.
+                result = await send_request(*args, **spec.options)
+                return BatchResult(index, spec, result=result)
+
+            charged = limiter is not None and spec.weight
+            if charged:
+                # 동시에 나가는 요청들이 허용량을 넘지 않도록 미리 기록하고,
+                # 캐시에서 응답되면 hl_rate_limited처럼 기록하지 않은 것으로 되돌린다.
+                await limiter.acquire(spec.weight, reserve=min_quota)
+            token = served_from_cache.set(False)
+            try:
+                result = await send_request_for_external(*args, **spec.options)
+            finally:
+                cached = served_from_cache.get()
+                served_from_cache.reset(token)
+                if charged and cached:
+                    await limiter.release(spec.weight)
+            return BatchResult(index, spec, result=result)
+        except Exception as e:
+            return BatchResult(index, spec, error=e)
+
+
+async def send_many(
+    specs: Sequence[RequestSpec],
+    concurrency: int = 20,
+    limiter: Optional[AsyncRateLimiter] = _default_async_limiter,
+    min_quota: float = 0,
+) -> List[BatchResult]:
+    """
+    여러 요청을 동시성 제한과 rate limit weight를 지키며 보내고, 입력 순서대로 결과를 반환한다.
+
+    Args:
+        specs (Sequence[RequestSpec]): 보낼 요청 목록.
+        concurrency (int): 동시에 진행할 최대 요청 수.
+        limiter (Optional[AsyncRateLimiter]): external 요청의 weight를 기록/대기할
+            rate limiter. None이면 weight를 고려하지 않는다.
+        min_quota (float): 다른 작업을 위해 항상 남겨 둘 허용량.
+
+    Returns:
+        List[BatchResult]: 요청별 결과. 실패한 요청은 error에 예외가 담기며
+            다른 요청에는 영향을 주지 않는다.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(
+        *(
+            _send_spec(i, spec, semaphore, limiter, min_quota)
+            for i, spec in enumerate(specs)
         )
+    )
+
+
+async def iter_many(
+    specs: Sequence[RequestSpec],
+    concurrency: int = 20,
+    limiter: Optional[AsyncRateLimiter] = _default_async_limiter,
+    min_quota: float = 0,
+) -> AsyncIterator[BatchResult]:
+    """
+    send_many와 같지만 완료되는 순서대로 결과를 yield한다.
+    순회를 중간에 멈추면 남은 요청은 취소된다.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = [
+        asyncio.ensure_future(_send_spec(i, spec, semaphore, limiter, min_quota))
+        for i, spec in enumerate(specs)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+def get_http_metrics() -> Dict[str, Any]:
+    """
+    HTTP 클라이언트 계측 전체 스냅샷.
+    엔드포인트별 지연 히스토그램/상태 코드/재시도/바이트/in-flight와
+    풀, 서킷, 재시도 예산, 병합, 캐시, hedge 통계를 함께 반환한다.
+    """
+    return {
+        "since": http_metrics.started_at,
+        "endpoints": http_metrics.snapshot(),
+        "pools": get_pool_stats(),
+        "circuits": get_circuit_states(),
+        "retry_budgets": get_retry_stats(),
+        "single_flight": get_single_flight_stats(),
+        "response_cache": get_response_cache_stats(),
+        "hedge": get_hedge_stats(),
+    }
+
+
+def get_single_flight_stats() -> Dict[str, int]:
+    """
+    동일 요청 병합 카운터(hits/misses/coalesced)를 반환한다.
+    """
+    return _single_flight.stats()
+
+
+def get_response_cache_stats() -> Dict[str, Any]:
+    """
+    /info 응답 캐시의 hit/miss/eviction 카운터와 현재 크기를 반환한다.
+    """
+    return _response_cache.stats()
+
+
+def clear_response_cache() -> None:
+    _response_cache.clear()
@@ -0,0 +1,203 @@
+from hypurrquant_fastapi_core.api.columnar import ColumnarSnapshot
+from hypurrquant_fastapi_core.logging_config import configure_logging
+from hypurrquant_fastapi_core.paired_symbols import symbol_resolver
+from hypurrquant_fastapi_core.utils.memory_profiler import memory_profiler
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+logger = configure_logging(__name__)
+
+# Hyperliquid perp funding은 1시간마다 정산된다.
+FUNDING_PERIODS_PER_YEAR = 24 * 365
+
+BASIS_FIELDS: Sequence[str] = (
+    "spot_px",  # spot midPx (없으면 markPx)
+    "perp_px",  # perp midPx (없으면 markPx)
+    "oracle_px",
+    "basis",  # perp_px - spot_px
+    "basis_pct",  # basis / spot_px
+    "funding",  # 1시간 funding rate
+    "funding_apr",  # funding 연환산 (perp short · spot long 기준 수취율)
+    "impact_bid",
+    "impact_ask",
+    "impact_spread_pct",  # (impact_ask - impact_bid) / perp_px
+    "entry_basis_pct",  # spot 매수 + perp impact_bid 매도로 진입할 때의 basis
+    "exit_basis_pct",  # spot 매도 + perp impact_ask 매수로 청산할 때의 basis
+)
+
+
+@dataclass(frozen=True)
+class BasisSnapshot:
+    """
+    페어 심볼 전체의 basis/funding/spread 계산 결과 (한 번 만든 뒤 수정하지 않는다).
+    columns의 행 키는 display 심볼이다.
+    """
+
+    versions: Tuple[int, int] = (0, 0)  # (hyqFetch.version, perp_market_data_cache.version)
+    prices_at: float = 0.0  # 계산에 쓴 spot 가격 시각 (apply_mid_prices 반영 여부 확인용)
+    columns: Optional[ColumnarSnapshot] = None
+    skipped: Tuple[str, ...] = ()  # 어느 한쪽 스냅샷에서 찾지 못해 제외한 display 심볼
+
+
+def _prefer_mid(mid: np.ndarray, mark: np.ndarray) -> np.ndarray:
+    return np.where(np.isnan(mid), mark, mid)
+
+
+def compute_basis(
+    spot_snapshot, perp_snapshot, configs
+) -> Tuple[ColumnarSnapshot, List[str]]:
+    """
+    spot/perp 스냅샷을 configs(SymbolConfig 목록)로 join해서 BASIS_FIELDS를 한 번에 계산한다.
+    어느 한쪽 스냅샷에 없는 쌍은 제외하고, 제외한 display 목록을 함께 반환한다.
+    spot_coin이 없는 config(symbol_table 기본값)는 spot Tname으로 coin을 찾는다.
+    """
+    spot_rows_of = spot_snapshot.columns.row_of
+    perp_rows_of = perp_snapshot.columns.row_of
+    spot_by_Tname = spot_snapshot.coin_by_Tname
+    displays: List[str] = []
+    spot_rows: List[int] = []
+    perp_rows: List[int] = []
+    skipped: List[str] = []
+    for cfg in configs:
+        spot_coin = cfg.spot_coin
+        if spot_coin is None:
+            spot_data = spot_by_Tname.get(cfg.spot)
+            spot_coin = spot_data.coin if spot_data is not None else None
+        spot_row = spot_rows_of.get(spot_coin)
+        perp_row = perp_rows_of.get(cfg.perp)
+        if spot_row is None or perp_row is None:
+            skipped.append(cfg.display)
+            continue
+        displays.append(cfg.display)
+        spot_rows.append(spot_row)
+        perp_rows.append(perp_row)
+
+    spot = spot_snapshot.columns.array[np.asarray(spot_rows, dtype=np.intp)]
+    perp = perp_snapshot.columns.array[np.asarray(perp_rows, dtype=np.intp)]
+    impact = perp_snapshot.impact_pxs[np.asarray(perp_rows, dtype=np.intp)]
+
+    array = np.empty(len(displays), dtype=[(name, np.float64) for name in BASIS_FIELDS])
+    spot_px = _prefer_mid(spot["midPx"], spot["markPx"])
+    perp_px = _prefer_mid(perp["midPx"], perp["markPx"])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        array["spot_px"] = spot_px
+        array["perp_px"] = perp_px
+        array["oracle_px"] = perp["oraclePx"]
+        array["basis"] = perp_px - spot_px
+        array["basis_pct"] = (perp_px - spot_px) / spot_px
+        array["funding"] = perp["funding"]
+        array["funding_apr"] = perp["funding"] * FUNDING_PERIODS_PER_YEAR
+        array["impact_bid"] = impact[:, 0]
+        array["impact_ask"] = impact[:, 1]
+        array["impact_spread_pct"] = (impact[:, 1] - impact[:, 0]) / perp_px
+        array["entry_basis_pct"] = (impact[:, 0] - spot_px) / spot_px
+        array["exit_basis_pct"] = (impact[:, 1] - spot_px) / spot_px
+    return ColumnarSnapshot(displays, array), skipped
+
+
+class BasisEngine:
+    """
+    symbol_resolver의 spot↔perp 쌍 전체에 대한 basis, funding 연환산, impactPxs 스프레드.
+
+    조회할 때 spot/perp 캐시의 version과 spot 가격 시각이 바뀌었으면 한 번 다시 계산하고,
+    그 외에는 캐시된 BasisSnapshot을 그대로 쓴다. 쌍별로 두 캐시를 따로 조회하지 않는다.
+
+    예: 연환산 funding 20% 이상 중 진입 basis가 가장 작은 5개
+        cols = basis_engine.columns
+        basis_engine.top_k("entry_basis_pct", 5, cols["funding_apr"] >= 0.2, descending=False)
+    """
+
+    def __init__(self):
+        self._snapshot = BasisSnapshot(
+            columns=ColumnarSnapshot(
+                [], np.empty(0, dtype=[(name, np.float64) for name in BASIS_FIELDS])
+            )
+        )
+        self.computes = 0
+
+    @property
+    def snapshot(self) -> BasisSnapshot:
+        # 캐시 싱글턴은 symbol_resolver와 같이 처음 조회할 때 import한다 (import 순서 결합 방지).
+        from hypurrquant_fastapi_core.api.market_data import hyqFetch
+        from hypurrquant_fastapi_core.api.perp_market_data import (
+            perp_market_data_cache,
+        )
+
+        spot, perp = hyqFetch.snapshot, perp_market_data_cache.snapshot
+        versions = (spot.version, perp.version)
+        snapshot = self._snapshot
+        if (
+            (versions, spot.prices_at) != (snapshot.versions, snapshot.prices_at)
+            and spot.columns is not None
+            and perp.columns is not None
+        ):
+            # 쌍 매핑도 같은 버전의 캐시로 갱신된다.
+            configs = symbol_resolver.index.by_display.values()
+            columns, skipped = compute_basis(spot, perp, configs)
+            if skipped and versions != snapshot.versions:
+                logger.info(f"basis 계산에서 제외한 심볼: {skipped}")
+            snapshot = self._snapshot = BasisSnapshot(
+                versions=versions,
+                prices_at=spot.prices_at,
+                columns=columns,
+                skipped=tuple(skipped),
+            )
+            self.computes += 1
+        return snapshot
+
+    @property
+    def columns(self) -> ColumnarSnapshot:
+        return self.snapshot.columns
+
+    @property
+    def skipped(self) -> List[str]:
+        """
+        페어 매핑에는 있지만 spot/perp 스냅샷에서 찾지 못해 결과에 없는 display 심볼.
+        """
+        return list(self.snapshot.skipped)
+
+    def get(self, display: str) -> Optional[Dict[str, Any]]:
+        columns = self.columns
+        row = columns.row_of.get(display)
+        return None if row is None else self._record(columns, row)
+
+    def sort_by(
+        self,
+        field: str,
+        mask: Optional[np.ndarray] = None,
+        descending: bool = True,
+    ) -> List[Dict[str, Any]]:
+        columns = self.columns
+        return [
+            self._record(columns, row)
+            for row in columns.sort(field, mask, descending)
+        ]
+
+    def top_k(
+        self,
+        field: str,
+        k: int,
+        mask: Optional[np.ndarray] = None,
+        descending: bool = True,
+    ) -> List[Dict[str, Any]]:
+        columns = self.columns
+        return [
+            self._record(columns, row)
+            for row in columns.top_k(field, k, mask, descending)
+        ]
+
+    def as_records(self) -> List[Dict[str, Any]]:
+        columns = self.columns
+        return [self._record(columns, row) for row in range(len(columns))]
+
+    @staticmethod
+    def _record(columns: ColumnarSnapshot, row: int) -> Dict[str, Any]:
+        values = columns.array[row]
+        record: Dict[str, Any] = {"display": columns.keys[row]}
+        record.update((name, float(values[name])) for name in columns.fields)
+        return record
+
+
+basis_engine = BasisEngine()
+memory_profiler.register_cache("BasisEngine", lambda: basis_engine._snapshot)
@@ -0,0 +1,156 @@
+"""
+CANDLE_BY_TICKER_INTERVAL Redis 값의 바이너리 컬럼 포맷.
+
+    header (16 bytes, little endian): magic b"HYQCNDL1", rows(uint32), reserved(uint32)
+    int64   (3, rows): t(open ms), T(close ms), n(체결 수)
+    float64 (5, rows): open, close, high, low, volume
+
+JSON(candleSnapshot 응답 그대로)보다 작고, 읽을 때는 np.frombuffer로 바로 배열을 만들므로
+파싱/문자열→float 변환이 없다. 앞 8바이트가 magic이 아니면 JSON으로 읽는다(마이그레이션 중 호환).
+"""
+
+from hypurrquant_fastapi_core.api.json_codec import decode_json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Union
+import numpy as np
+import os
+import pandas as pd
+import struct
+
+# DelegateResolver가 Redis에 쓰는 포맷: json / binary
+# 이전 버전 서비스는 binary 값을 읽지 못하므로, 모든 reader를 업그레이드한 뒤 binary로 바꾼다.
+CANDLE_CACHE_FORMAT = os.getenv("CANDLE_CACHE_FORMAT", "json")
+
+CANDLE_MAGIC = b"HYQCNDL1"
+_HEADER = struct.Struct("<8sII")
+
+INT_FIELDS: Sequence[str] = ("t", "T", "n")
+FLOAT_FIELDS: Sequence[str] = ("o", "c", "h", "l", "v")
+# candleSnapshot 키 → DataFrame 컬럼 이름 (CandleService가 써 오던 이름)
+FRAME_COLUMNS: Dict[str, str] = {
+    "o": "open",
+    "c": "close",
+    "h": "high",
+    "l": "low",
+    "v": "volume",
+}
+
+
+@dataclass(frozen=True)
+class CandleArrays:
+    """
+    decode_candles 결과. 모든 배열은 payload를 그대로 보는 읽기 전용 view다.
+    """
+
+    ints: np.ndarray  # (3, rows) int64: t, T, n
+    floats: np.ndarray  # (5, rows) float64: open, close, high, low, volume
+
+    def __len__(self) -> int:
+        return self.ints.shape[1]
+
+    @property
+    def open_time(self) -> np.ndarray:
+        return self.ints[0]
+
+    @property
+    def close_time(self) -> np.ndarray:
+        return self.ints[1]
+
+    @property
+    def trades(self) -> np.ndarray:
+        return self.ints[2]
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        """
+        candleSnapshot 키("o", "t" 등) 또는 DataFrame 컬럼 이름("open" 등)으로 열을 꺼낸다.
+        """
+        for index, name in enumerate(FLOAT_FIELDS):
+            if key in (name, FRAME_COLUMNS[name]):
+                return self.floats[index]
+        return self.ints[INT_FIELDS.index(key)]
+
+
+def is_binary_candles(payload: Union[bytes, str]) -> bool:
+    return isinstance(payload, (bytes, bytearray, memoryview)) and bytes(
+        payload[: len(CANDLE_MAGIC)]
+    ) == CANDLE_MAGIC
+
+
+def encode_candles(candles: List[Dict[str, Any]]) -> bytes:
+    """
+    candleSnapshot 응답(값이 문자열인 dict 목록)을 바이너리 포맷으로 만든다.
+    """
+    rows = len(candles)
+    ints = np.empty((len(INT_FIELDS), rows), dtype="<i8")
+    floats = np.empty((len(FLOAT_FIELDS), rows), dtype="<f8")
+    for index, name in enumerate(INT_FIELDS):
+        ints[index] = [candle[name] for candle in candles]
+    for index, name in enumerate(FLOAT_FIELDS):
+        # numpy가 "1.23" 같은 문자열을 바로 float64로 바꾼다.
+        floats[index] = np.array([candle[name] for candle in candles], dtype="<f8")
+    return _HEADER.pack(CANDLE_MAGIC, rows, 0) + ints.tobytes() + floats.tobytes()
+
+
+def decode_candles(payload: bytes) -> CandleArrays:
+    """
+    encode_candles 결과를 복사 없이 배열 view로 읽는다.
+    """
+    magic, rows, _ = _HEADER.unpack_from(payload)
+    if magic != CANDLE_MAGIC:
+        raise ValueError("not a binary candle payload")
+    expected = _HEADER.size + rows * 8 * (len(INT_FIELDS) + len(FLOAT_FIELDS))
+    if len(payload) != expected:
+        raise ValueError(f"candle payload size {len(payload)} != {expected}")
+    ints_count = len(INT_FIELDS) * rows
+    ints = np.frombuffer(payload, "<i8", ints_count, _HEADER.size)
+    floats = np.frombuffer(
+        payload, "<f8", len(FLOAT_FIELDS) * rows, _HEADER.size + ints_count * 8
+    )
+    return CandleArrays(
+        ints=ints.reshape(len(INT_FIELDS), rows),
+        floats=floats.reshape(len(FLOAT_FIELDS), rows),
+    )
+
+
+def candles_to_frame(candles: CandleArrays, ticker: str, interval: str) -> pd.DataFrame:
+    """
+    JSON 경로와 같은 모양의 DataFrame (index=time, T/s/i/n + OHLCV float 컬럼).
+    호출 측이 값을 수정할 수 있도록 OHLCV 블록은 payload(읽기 전용)에서 한 번 복사한다.
+    복사 없는 읽기 전용 배열이 필요하면 decode_candles를 직접 쓴다.
+    """
+    df = pd.DataFrame(
+        candles.floats.copy().T,
+        columns=[FRAME_COLUMNS[name] for name in FLOAT_FIELDS],
+        index=pd.DatetimeIndex(
+            pd.to_datetime(candles.open_time, unit="ms"), name="time"
+        ),
+        copy=False,
+    )
+    df.insert(0, "T", candles.close_time)
+    df.insert(1, "s", ticker)
+    df.insert(2, "i", interval)
+    df["n"] = candles.trades
+    return df
+
+
+def json_candles_to_frame(payload: Union[bytes, str]) -> pd.DataFrame:
+    """
+    기존 JSON 포맷(candleSnapshot 응답 그대로)을 DataFrame으로 읽는다.
+    """
+    df = pd.DataFrame(decode_json(payload))
+    df.rename(
+        columns={"t": "time", **FRAME_COLUMNS},
+        inplace=True,
+    )
+    df["time"] = pd.to_datetime(df["time"], unit="ms")
+    df.set_index("time", inplace=True)
+    df = df.astype({name: float for name in FRAME_COLUMNS.values()})
+    return df
+
+
+def payload_to_frame(
+    payload: Union[bytes, str], ticker: str, interval: str
+) -> pd.DataFrame:
+    if is_binary_candles(payload):
+        return candles_to_frame(decode_candles(payload), ticker, interval)
+    return json_candles_to_frame(payload)
@@ -0,0 +1,165 @@
+from hypurrquant_fastapi_core.logging_config import configure_logging
+from hypurrquant_fastapi_core.exception import CircuitOpenException
+from enum import Enum
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+import time
+
+logger = configure_logging(__name__)
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    호스트 단위 서킷 브레이커.
+
+    - CLOSED: 연속 실패가 failure_threshold에 도달하면 OPEN으로 전환.
+    - OPEN: recovery_timeout 동안 모든 호출을 CircuitOpenException으로 즉시 거절.
+    - HALF_OPEN: recovery_timeout마다 probe 호출을 하나만 통과시키고,
+      성공하면 CLOSED, 실패하면 다시 OPEN.
+
+    상태 변경은 모두 동기 코드(await 없음)에서 일어나므로 이벤트 루프 안에서는
+    별도의 락이 필요 없다.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 10.0,
+    ):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_at: Optional[float] = None
+        self._last_failure_reason: Optional[str] = None
+        self.total_failures = 0
+        self.total_rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def is_open(self) -> bool:
+        """
+        요청이 거절되는 상태인지 반환한다(recovery_timeout이 지나 probe 가능한 경우는 False).
+        """
+        if self._state == CircuitState.CLOSED:
+            return False
+        started = self._opened_at if self._state == CircuitState.OPEN else self._probe_at
+        return time.monotonic() - started < self.recovery_timeout
+
+    def before_call(self) -> None:
+        """
+        호출 전에 실행한다. 호출할 수 없는 상태면 CircuitOpenException을 던진다.
+        """
+        if self._state == CircuitState.CLOSED:
+            return
+
+        now = time.monotonic()
+        started = self._opened_at if self._state == CircuitState.OPEN else self._probe_at
+        if now - started >= self.recovery_timeout:
+            # probe 호출 하나를 통과시킨다.
+            if self._state == CircuitState.OPEN:
+                logger.info(f"[{self.host}] circuit half-open, probe 요청을 보냅니다.")
+            self._state = CircuitState.HALF_OPEN
+            self._probe_at = now
+            return
+
+        self.total_rejected += 1
+        raise CircuitOpenException(
+            f"{self.host} 서킷이 열려 있어 요청을 보내지 않습니다. "
+            f"(reason={self._last_failure_reason})"
+        )
+
+    def record_success(self) -> None:
+        if self._state != CircuitState.CLOSED:
+            logger.info(f"[{self.host}] circuit closed.")
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._probe_at = None
+
+    def record_failure(self, reason: str) -> None:
+        self.total_failures += 1
+        self._consecutive_failures += 1
+        self._last_failure_reason = reason
+        if self._state == CircuitState.HALF_OPEN or (
+            self._state == CircuitState.CLOSED
+            and self._consecutive_failures >= self.failure_threshold
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_at = None
+        self.times_opened += 1
+        logger.error(
+            f"[{self.host}] circuit open: 연속 실패 {self._consecutive_failures}회 "
+            f"(reason={self._last_failure_reason}), {self.recovery_timeout}초 동안 요청을 거절합니다."
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "host": self.host,
+            "state": self._state.value,
+            "is_open": self.is_open(),
+            "consecutive_failures": self._consecutive_failures,
+            "last_failure_reason": self._last_failure_reason,
+            "total_failures": self.total_failures,
+            "total_rejected": self.total_rejected,
+            "times_opened": self.times_opened,
+        }
+
+
+class CircuitBreakerRegistry:
+    """
+    host(netloc) → CircuitBreaker 레지스트리.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 10.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                host, self.failure_threshold, self.recovery_timeout
+            )
+            self._breakers[host] = breaker
+        return breaker
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        return self.get(urlsplit(url).netloc)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {host: b.snapshot() for host, b in self._breakers.items()}
+
+
+circuit_breakers = CircuitBreakerRegistry()
+
+
+def get_circuit_states() -> Dict[str, Dict[str, Any]]:
+    """
+    호스트별 서킷 상태를 반환한다.
+    """
+    return circuit_breakers.snapshot()
+
+
+def is_circuit_open(url: str) -> bool:
+    """
+    url의 호스트로 가는 요청이 현재 즉시 거절되는 상태인지 반환한다.
+    """
+    return circuit_breakers.for_url(url).is_open()
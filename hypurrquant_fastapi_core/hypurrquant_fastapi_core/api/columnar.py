@@ -0,0 +1,151 @@
+from typing import Any, Iterable, List, Optional, Sequence
+import numpy as np
+
+# spot MarketData 중 벡터 연산 대상 숫자 필드
+SPOT_NUMERIC_FIELDS: Sequence[str] = (
+    "prevDayPx",
+    "dayNtlVlm",
+    "markPx",
+    "midPx",
+    "circulatingSupply",
+    "totalSupply",
+    "dayBaseVlm",
+    "MarketCap",
+    "change_24h",
+    "change_24h_pct",
+)
+
+# perp MarketData 중 벡터 연산 대상 숫자 필드
+PERP_NUMERIC_FIELDS: Sequence[str] = (
+    "maxLeverage",
+    "funding",
+    "openInterest",
+    "prevDayPx",
+    "dayNtlVlm",
+    "premium",
+    "oraclePx",
+    "markPx",
+    "midPx",
+    "dayBaseVlm",
+)
+
+
+class ColumnarSnapshot:
+    """
+    모델 객체 목록의 숫자 필드를 float64 구조화 배열로 모아 둔 읽기 전용 스냅샷.
+
+    행 순서는 원본 목록 순서와 같으므로 쿼리 결과(행 인덱스)로 원본 객체를 바로 찾을 수 있다.
+    마스크는 snapshot["dayNtlVlm"] > x 처럼 컬럼에 numpy 연산을 해서 만든다.
+    """
+
+    def __init__(self, keys: Sequence[str], array: np.ndarray):
+        self.keys = list(keys)
+        self.array = array
+        self.array.flags.writeable = False
+        self.fields: Sequence[str] = array.dtype.names or ()
+        self.row_of = {key: i for i, key in enumerate(self.keys)}
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Sequence[Any],
+        fields: Sequence[str],
+        key: str,
+    ) -> "ColumnarSnapshot":
+        """
+        records의 fields 속성으로 스냅샷을 만든다. 값이 None이면 NaN으로 채운다.
+        """
+        dtype = np.dtype([(name, np.float64) for name in fields])
+        array = np.empty(len(records), dtype=dtype)
+        for name in fields:
+            array[name] = [
+                np.nan if (value := getattr(record, name)) is None else value
+                for record in records
+            ]
+        return cls([getattr(record, key) for record in records], array)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.array[field]
+
+    def between(
+        self,
+        field: str,
+        low: Optional[float] = None,
+        high: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        low <= field <= high 마스크 (None인 경계는 무시).
+        """
+        column = self.array[field]
+        mask = ~np.isnan(column)
+        if low is not None:
+            mask &= column >= low
+        if high is not None:
+            mask &= column <= high
+        return mask
+
+    def filter(self, mask: np.ndarray) -> np.ndarray:
+        """
+        마스크가 True인 행 인덱스.
+        """
+        return np.flatnonzero(mask)
+
+    def sort(
+        self,
+        field: str,
+        mask: Optional[np.ndarray] = None,
+        descending: bool = True,
+    ) -> np.ndarray:
+        """
+        field 기준으로 정렬한 행 인덱스. NaN은 제외한다.
+        """
+        column = self.array[field]
+        valid = ~np.isnan(column)
+        if mask is not None:
+            valid &= mask
+        rows = np.flatnonzero(valid)
+        order = np.argsort(column[rows], kind="stable")
+        if descending:
+            order = order[::-1]
+        return rows[order]
+
+    def top_k(
+        self,
+        field: str,
+        k: int,
+        mask: Optional[np.ndarray] = None,
+        descending: bool = True,
+    ) -> np.ndarray:
+        """
+        field 상위(descending=False면 하위) k개 행 인덱스. 전체 정렬 대신 argpartition을 쓴다.
+        """
+        column = self.array[field]
+        valid = ~np.isnan(column)
+        if mask is not None:
+            valid &= mask
+        rows = np.flatnonzero(valid)
+        if k <= 0 or rows.size == 0:
+            return rows[:0]
+        values = -column[rows] if descending else column[rows]
+        if k < rows.size:
+            part = np.argpartition(values, k - 1)[:k]
+            rows, values = rows[part], values[part]
+        return rows[np.argsort(values, kind="stable")]
+
+    def patched(
+        self, fields: Sequence[str], rows: Sequence[int], values: Sequence[float]
+    ) -> "ColumnarSnapshot":
+        """
+        rows 행의 fields 값을 values로 바꾼 새 스냅샷 (배열 복사 1회, 원본은 그대로).
+        """
+        array = self.array.copy()
+        rows = np.asarray(rows, dtype=np.intp)
+        for field in fields:
+            array[field][rows] = values
+        return ColumnarSnapshot(self.keys, array)
+
+    def keys_at(self, rows: Iterable[int]) -> List[str]:
+        return [self.keys[i] for i in rows]
@@ -0,0 +1,167 @@
+from hypurrquant_fastapi_core.logging_config import configure_logging
+from hypurrquant_fastapi_core.api.retry_budget import RetryBudgetRegistry
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import time
+
+logger = configure_logging(__name__)
+
+
+class LatencyTracker:
+    """
+    최근 max_samples개 성공 응답의 지연 시간으로 분위수를 추정한다.
+    분위수는 recompute_every개 샘플마다 다시 계산한다.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        max_samples: int = 512,
+        min_samples: int = 20,
+        recompute_every: int = 32,
+    ):
+        self.quantile = quantile
+        self.max_samples = max_samples
+        self.min_samples = min_samples
+        self.recompute_every = recompute_every
+        self._samples: List[float] = []
+        self._pos = 0
+        self._since_recompute = 0
+        self._cached: Optional[float] = None
+
+    def record(self, latency: float) -> None:
+        if len(self._samples) < self.max_samples:
+            self._samples.append(latency)
+        else:
+            self._samples[self._pos] = latency
+            self._pos = (self._pos + 1) % self.max_samples
+        self._since_recompute += 1
+        if self._cached is None or self._since_recompute >= self.recompute_every:
+            self._recompute()
+
+    def _recompute(self) -> None:
+        self._since_recompute = 0
+        if len(self._samples) < self.min_samples:
+            self._cached = None
+            return
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(self.quantile * len(ordered)))
+        self._cached = ordered[index]
+
+    def value(self) -> Optional[float]:
+        """샘플이 부족하면 None."""
+        return self._cached
+
+
+class HedgePolicy:
+    """
+    멱등 조회 요청용 hedging 정책.
+
+    첫 요청이 엔드포인트의 p95 지연(min_delay~max_delay로 제한) 안에 끝나지 않으면
+    같은 요청을 한 번 더 보내고, 먼저 성공한 쪽을 사용하며 나머지는 취소한다.
+    호스트별 hedge 요청은 최근 요청 수의 max_hedge_ratio 이하로 제한한다.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        min_delay: float = 0.02,
+        max_delay: float = 2.0,
+        max_hedge_ratio: float = 0.05,
+        window_sec: int = 10,
+    ):
+        self.quantile = quantile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._trackers: Dict[str, LatencyTracker] = {}
+        # 추가 요청 비율 제한은 재시도 예산과 같은 방식으로 관리한다.
+        self._budgets = RetryBudgetRegistry(
+            ratio=max_hedge_ratio, window_sec=window_sec, min_retries=1
+        )
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.denied = 0
+
+    def tracker(self, key: str) -> LatencyTracker:
+        tracker = self._trackers.get(key)
+        if tracker is None:
+            tracker = LatencyTracker(self.quantile)
+            self._trackers[key] = tracker
+        return tracker
+
+    def delay_for(self, key: str) -> Optional[float]:
+        value = self.tracker(key).value()
+        if value is None:
+            return None
+        return min(self.max_delay, max(self.min_delay, value))
+
+    async def _timed(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        started = time.perf_counter()
+        result = await call()
+        self.tracker(key).record(time.perf_counter() - started)
+        return result
+
+    async def run(
+        self, url: str, key: str, call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        self.requests += 1
+        budget = self._budgets.for_url(url)
+        budget.record_request()
+
+        delay = self.delay_for(key)
+        if delay is None:
+            # 아직 지연 분포를 모르면 hedging 없이 보낸다.
+            return await self._timed(key, call)
+
+        primary = asyncio.ensure_future(self._timed(key, call))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+
+            if not budget.try_acquire_retry():
+                self.denied += 1
+                return await primary
+
+            self.hedged += 1
+            hedge = asyncio.ensure_future(self._timed(key, call))
+            tasks.add(hedge)
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return task.result()
+                if not tasks:
+                    # 둘 다 실패하면 첫 요청의 예외를 그대로 던진다.
+                    return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "denied": self.denied,
+            "thresholds": {
+                key: tracker.value() for key, tracker in self._trackers.items()
+            },
+        }
+
+
+hedge_policy = HedgePolicy()
+
+
+def get_hedge_stats() -> Dict[str, Any]:
+    """
+    hedge 요청 수/승리 수/거절 수와 엔드포인트별 현재 hedge 임계값(p95)을 반환한다.
+    """
+    return hedge_policy.stats()
@@ -0,0 +1,201 @@
+from hypurrquant_fastapi_core.logging_config import configure_logging
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+import re
+import sys
+import time
+
+logger = configure_logging(__name__)
+
+# 지연 시간 히스토그램 버킷 상한(초). 마지막 버킷은 +Inf.
+LATENCY_BUCKETS: Sequence[float] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# 숫자, 0x 주소, 긴 hex/uuid 경로 조각은 {id}로 묶는다.
+_ID_SEGMENT = re.compile(r"^(\d+|0x[0-9a-fA-F]+|[0-9a-fA-F-]{16,})$")
+
+
+def path_template(path: str) -> str:
+    if not path:
+        return "/"
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+def endpoint_key(url: str, json_data: Optional[Any] = None) -> str:
+    """
+    host + path template (+ /info 요청 type) 단위 엔드포인트 키.
+    """
+    parts = urlsplit(url)
+    key = f"{parts.netloc}{path_template(parts.path)}"
+    if isinstance(json_data, dict) and isinstance(json_data.get("type"), str):
+        key = f"{key}#{json_data['type']}"
+    return key
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램. observe는 bisect 한 번과 정수 증가뿐이라 요청마다 호출해도 싸다.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        버킷 안에서 선형 보간한 분위수 추정값. 관측값이 없으면 None.
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                if i >= len(self.buckets):
+                    return lower  # +Inf 버킷
+                upper = self.buckets[i]
+                return lower + (upper - lower) * ((rank - cumulative) / bucket_count)
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, bucket_count in zip((*self.buckets, float("inf")), self.counts):
+            cumulative += bucket_count
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "avg": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class EndpointMetrics:
+    def __init__(self, key: str):
+        self.key = key
+        self.latency = Histogram()
+        self.status_counts: Dict[int, int] = {}
+        self.error_counts: Dict[str, int] = {}
+        self.requests = 0
+        self.retries = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.in_flight = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "in_flight": self.in_flight,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "status": {str(k): v for k, v in self.status_counts.items()},
+            "errors": dict(self.error_counts),
+            "latency": self.latency.snapshot(),
+        }
+
+
+class RequestTracker:
+    """
+    시도 1회의 계측. 호출부는 응답을 받으면 status/bytes를 채우고 finish()를 호출한다.
+    finish() 시점에 status가 없으면 처리 중인 예외 타입을 오류로 기록한다.
+    """
+
+    __slots__ = ("metrics", "started", "status", "bytes_in", "bytes_out")
+
+    def __init__(self, metrics: EndpointMetrics):
+        self.metrics = metrics
+        self.started = time.perf_counter()
+        self.status: Optional[int] = None
+        self.bytes_in = 0
+        self.bytes_out = 0
+        metrics.requests += 1
+        metrics.in_flight += 1
+
+    def set_response(self, response) -> None:
+        self.status = response.status
+        content_length = response.request_info.headers.get("Content-Length")
+        if content_length and content_length.isdigit():
+            self.bytes_out = int(content_length)
+
+    def finish(self) -> None:
+        metrics = self.metrics
+        metrics.in_flight -= 1
+        metrics.latency.observe(time.perf_counter() - self.started)
+        metrics.bytes_in += self.bytes_in
+        metrics.bytes_out += self.bytes_out
+        if self.status is not None:
+            metrics.status_counts[self.status] = (
+                metrics.status_counts.get(self.status, 0) + 1
+            )
+        else:
+            exc_type = sys.exc_info()[0]
+            name = exc_type.__name__ if exc_type else "unknown"
+            metrics.error_counts[name] = metrics.error_counts.get(name, 0) + 1
+
+
+class HttpMetrics:
+    """
+    엔드포인트별 HTTP 클라이언트 메트릭 레지스트리 (프로세스 내 집계, 로그 없음).
+    """
+
+    def __init__(self):
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self.started_at = time.time()
+
+    def endpoint(self, key: str) -> EndpointMetrics:
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            metrics = EndpointMetrics(key)
+            self._endpoints[key] = metrics
+        return metrics
+
+    def track(self, url: str, json_data: Optional[Any] = None) -> RequestTracker:
+        return RequestTracker(self.endpoint(endpoint_key(url, json_data)))
+
+    def record_retry(self, url: str, json_data: Optional[Any] = None) -> None:
+        self.endpoint(endpoint_key(url, json_data)).retries += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {key: m.snapshot() for key, m in self._endpoints.items()}
+
+    def endpoints(self) -> List[str]:
+        return list(self._endpoints)
+
+    def reset(self) -> None:
+        self._endpoints.clear()
+        self.started_at = time.time()
+
+
+http_metrics = HttpMetrics()
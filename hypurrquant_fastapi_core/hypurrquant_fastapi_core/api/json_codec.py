@@ -0,0 +1,81 @@
+from hypurrquant_fastapi_core.logging_config import configure_logging
+from typing import Any, Callable, Dict, Union
+import json
+import os
+
+logger = configure_logging(__name__)
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # 선택 의존성
+    msgspec = None
+
+JsonDecoder = Callable[[Union[bytes, str]], Any]
+
+
+def _available_decoders() -> Dict[str, JsonDecoder]:
+    decoders: Dict[str, JsonDecoder] = {"json": json.loads}
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+    if msgspec is not None:
+        decoders["msgspec"] = msgspec.json.decode
+    return decoders
+
+
+DECODERS = _available_decoders()
+
+# 설치된 것 중 가장 빠른 디코더를 기본값으로 사용한다. (JSON_DECODER로 강제 가능)
+_PREFERRED_ORDER = ("orjson", "msgspec", "json")
+
+_decoder_name = "json"
+_decoder: JsonDecoder = json.loads
+
+
+def set_decoder(decoder: Union[str, JsonDecoder]) -> None:
+    """
+    send_request / send_request_for_external가 사용할 JSON 디코더를 교체한다.
+
+    Args:
+        decoder: "orjson" / "msgspec" / "json" 이름 또는 bytes를 받는 callable.
+    """
+    global _decoder, _decoder_name
+    if callable(decoder):
+        _decoder = decoder
+        _decoder_name = getattr(decoder, "__qualname__", repr(decoder))
+        return
+    if decoder not in DECODERS:
+        raise ValueError(
+            f"사용할 수 없는 JSON 디코더입니다: {decoder} (available={list(DECODERS)})"
+        )
+    _decoder = DECODERS[decoder]
+    _decoder_name = decoder
+
+
+def get_decoder_name() -> str:
+    return _decoder_name
+
+
+def decode_json(body: Union[bytes, str]) -> Any:
+    return _decoder(body)
+
+
+def encode_json(value: Any) -> bytes:
+    """
+    설치되어 있으면 orjson, 아니면 json으로 bytes 인코딩한다.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+_env_decoder = os.getenv("JSON_DECODER")
+if _env_decoder:
+    set_decoder(_env_decoder)
+else:
+    set_decoder(next(name for name in _PREFERRED_ORDER if name in DECODERS))
+logger.debug(f"JSON decoder: {_decoder_name}")
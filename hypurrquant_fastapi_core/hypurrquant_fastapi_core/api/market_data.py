@@ -1,29 +1,143 @@
 from hypurrquant_fastapi_core.models.market_data import MarketData
 from hypurrquant_fastapi_core.singleton import singleton
 from hypurrquant_fastapi_core.api.async_http import send_request
+from hypurrquant_fastapi_core.api.columnar import ColumnarSnapshot, SPOT_NUMERIC_FIELDS
+from hypurrquant_fastapi_core.api.search_index import PrefixIndex, group_by
+from hypurrquant_fastapi_core.api.price_table import PriceTable
+from hypurrquant_fastapi_core.api.shared_snapshot import (
+    SharedSnapshotChannel,
+    default_shared_path,
+    default_warm_start_path,
+    read_snapshot_file,
+    write_snapshot_file,
+)
 from hypurrquant_fastapi_core.logging_config import configure_logging
+from hypurrquant_fastapi_core.utils.memory_profiler import memory_profiler
 from hypurrquant_fastapi_core.exception import (
     NoSuchTickerException,
     MarketDataException,
     NonJsonResponseIgnoredException,
 )
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field, replace
 
 
-from typing import List, Dict
-import tracemalloc
+from typing import Any, Callable, List, Dict, Optional, Tuple
+import numpy as np
 import os
 from dotenv import load_dotenv
 import asyncio
-import threading
+import time
 
 load_dotenv()
 
-tracemalloc.start()
-
 logger = configure_logging(__name__)
 DATA_SERVER_URL = os.getenv("BASE_URL")
 
+# worker 간 스냅샷 공유: off / auto / publisher / reader (shared_snapshot.py 참고)
+MARKET_DATA_SHARED_MODE = os.getenv("MARKET_DATA_SHARED_MODE", "off")
+MARKET_DATA_SHARED_PATH = os.getenv(
+    "MARKET_DATA_SHARED_PATH", default_shared_path("market_data.snap")
+)
+
+# warm start: 마지막 정상 스냅샷을 저장해 두었다가 시작할 때 stale 상태로 먼저 올린다.
+# 빈 문자열이면 사용하지 않는다. WARM_START_MAX_AGE(초)보다 오래된 파일은 쓰지 않는다.
+MARKET_DATA_WARM_START_PATH = os.getenv(
+    "MARKET_DATA_WARM_START_PATH", default_warm_start_path("market_data.warm")
+)
+WARM_START_PERSIST_INTERVAL = float(os.getenv("WARM_START_PERSIST_INTERVAL", "60"))
+WARM_START_MAX_AGE = float(os.getenv("WARM_START_MAX_AGE", "900"))
+
+
+@dataclass
+class MarketDataChange:
+    """
+    build_data 한 번으로 바뀐 코인 목록 (coin 기준).
+    """
+
+    version: int
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> List[str]:
+        return self.added + self.updated
+
+
+@dataclass(frozen=True)
+class MarketDataSnapshot:
+    """
+    build_data 한 번의 결과 (데이터 + 모든 인덱스).
+
+    HyqFetch는 새 스냅샷을 만든 뒤 참조 하나만 교체하므로, 읽는 쪽은 락 없이
+    스냅샷을 한 번 잡아서 쓰면 항상 같은 빌드의 데이터/인덱스를 보게 된다.
+    내부 list/dict는 공유되므로 수정하면 안 된다.
+    """
+
+    version: int = 0
+    built_at: float = 0.0  # time.time()
+    prices_at: float = 0.0  # 마지막 apply_mid_prices 시각 (time.time())
+    stale: bool = False  # warm start 파일에서 올린 뒤 아직 갱신되지 않은 스냅샷
+    market_datas: List[MarketData] = field(default_factory=list)
+    coin_list: List[str] = field(default_factory=list)
+    coin_by_Tname: Dict[str, MarketData] = field(default_factory=dict)
+    Tname_by_coin: Dict[str, MarketData] = field(default_factory=dict)
+    columns: Optional[ColumnarSnapshot] = None  # market_datas와 같은 행 순서
+    rows_by_coin: Dict[str, dict] = field(default_factory=dict)  # 파싱한 원본 row
+
+    # 보조 인덱스
+    by_sector: Dict[str, List[MarketData]] = field(default_factory=dict)
+    by_token_id: Dict[str, MarketData] = field(default_factory=dict)
+    by_token_index: Dict[int, MarketData] = field(default_factory=dict)  # index_y
+    by_evm_address: Dict[str, MarketData] = field(default_factory=dict)  # 소문자 주소
+    evm_market_datas: List[MarketData] = field(default_factory=list)  # evmContract 보유
+    name_index: PrefixIndex = field(default_factory=lambda: PrefixIndex(()))
+
+    @classmethod
+    def build(
+        cls,
+        version: int,
+        market_datas: List[MarketData],
+        rows_by_coin: Dict[str, dict],
+        built_at: Optional[float] = None,
+        columns_array: Optional[np.ndarray] = None,
+        stale: bool = False,
+    ) -> "MarketDataSnapshot":
+        """
+        columns_array가 주어지면(공유 스냅샷 파일의 배열 등) 복사 없이 columns로 쓴다.
+        """
+        coin_list = [spot_meta.coin for spot_meta in market_datas]
+        if columns_array is not None and len(columns_array) == len(market_datas):
+            columns = ColumnarSnapshot(coin_list, columns_array)
+        else:
+            columns = ColumnarSnapshot.from_records(
+                market_datas, SPOT_NUMERIC_FIELDS, key="coin"
+            )
+        evm_market_datas = [data for data in market_datas if data.evmContract]
+        return cls(
+            version=version,
+            built_at=time.time() if built_at is None else built_at,
+            stale=stale,
+            market_datas=market_datas,
+            coin_list=coin_list,
+            coin_by_Tname={data.Tname: data for data in market_datas},
+            Tname_by_coin={data.coin: data for data in market_datas},
+            columns=columns,
+            rows_by_coin=rows_by_coin,
+            by_sector=group_by(market_datas, lambda data: data.sector),
+            by_token_id={data.tokenId: data for data in market_datas},
+            by_token_index={data.index_y: data for data in market_datas},
+            by_evm_address={
+                data.evmContract.address.lower(): data
+                for data in evm_market_datas
+            },
+            evm_market_datas=evm_market_datas,
+            name_index=PrefixIndex(
+                [(data.Tname, data) for data in market_datas]
+                + [(data.fullName, data) for data in market_datas]
+            ),
+        )
+
 
 # TODO GracefulShutdownMixin을 상속받아야함
 @singleton
@@ -57,113 +171,509 @@ class HyqFetch:
         sector=None,
     )
 
-    def __init__(self, evm_cache_ttl: timedelta = timedelta(minutes=10)):
-        self._market_datas: List[MarketData] = []
-        self._coin_list = []
-        self._coin_by_Tname: Dict[str, MarketData] = None
-        self._Tname_by_coin: Dict[str, MarketData] = None
-        self._lock = threading.RLock()  # 재진입 가능한 락
-        self._async_lock = asyncio.Lock()
-        self._evm_cache = None
-        self._cache_timestamp = None
-        self._cache_ttl = evm_cache_ttl
+    def __init__(self):
+        # 읽기는 락 없이 self._snapshot을 한 번 읽어서 사용한다.
+        self._snapshot = MarketDataSnapshot()
+        # coin → midPx 가격 테이블 (build_data와 apply_mid_prices가 함께 갱신)
+        self.prices = PriceTable()
+        self._shared: Optional[SharedSnapshotChannel] = None
+        if MARKET_DATA_SHARED_MODE != "off":
+            self.enable_shared(MARKET_DATA_SHARED_MODE, MARKET_DATA_SHARED_PATH)
+
+        # delta 갱신 상태
+        self._etag: Optional[str] = None
+        self._subscribers: List[Callable[[MarketDataChange], Any]] = []
+        self.build_stats = {
+            "builds": 0,
+            "not_modified": 0,  # 304 또는 내용 동일로 건너뛴 횟수
+            "rows_parsed": 0,
+            "rows_reused": 0,
+            "price_updates": 0,  # apply_mid_prices 적용 횟수
+        }
+
+        self._warm_start_path = MARKET_DATA_WARM_START_PATH
+        self._persisted_at = 0.0
+        if self._warm_start_path:
+            self.load_warm_start()
+
+    @property
+    def snapshot(self) -> MarketDataSnapshot:
+        """
+        현재 스냅샷. 여러 인덱스를 함께 읽을 때는 이 값을 한 번 받아서 사용한다.
+        """
+        return self._snapshot
 
     @property
     def coin_list(self):
-        with self._lock:
-            if not self._coin_list:
-                logger.error("Coin list is empty")
-            return self._coin_list
+        coin_list = self._snapshot.coin_list
+        if not coin_list:
+            logger.error("Coin list is empty")
+        return coin_list
 
     @property
     def coin_by_Tname(self):
-        with self._lock:
-            if not self._coin_by_Tname:
-                logger.error("Coin by Tname is empty")
-            return self._coin_by_Tname
+        coin_by_Tname = self._snapshot.coin_by_Tname
+        if not coin_by_Tname:
+            logger.error("Coin by Tname is empty")
+        return coin_by_Tname
 
     @property
     def Tname_by_coin(self):
-        with self._lock:
-            if not self._Tname_by_coin:
-                logger.error("Tname by coin is empty")
-            return self._Tname_by_coin
+        Tname_by_coin = self._snapshot.Tname_by_coin
+        if not Tname_by_coin:
+            logger.error("Tname by coin is empty")
+        return Tname_by_coin
 
     @property
     def market_datas(self):
-        with self._lock:
-            if not self._market_datas:
-                logger.error("Market data is empty")
-                raise MarketDataException("Market data is empty")
-            return self._market_datas
+        market_datas = self._snapshot.market_datas
+        if not market_datas:
+            logger.error("Market data is empty")
+            raise MarketDataException("Market data is empty")
+        return market_datas
+
+    @property
+    def columns(self) -> ColumnarSnapshot:
+        """
+        market_datas 숫자 필드의 columnar 스냅샷 (build_data 시점에 생성).
+        """
+        columns = self._snapshot.columns
+        if columns is None:
+            logger.error("Market data is empty")
+            raise MarketDataException("Market data is empty")
+        return columns
+
+    def _query(self, query: Callable[[ColumnarSnapshot], np.ndarray]) -> List[MarketData]:
+        # columns와 market_datas를 같은 스냅샷에서 읽는다.
+        snapshot = self._snapshot
+        if snapshot.columns is None:
+            logger.error("Market data is empty")
+            raise MarketDataException("Market data is empty")
+        market_datas = snapshot.market_datas
+        return [market_datas[i] for i in query(snapshot.columns)]
+
+    def screen(self, mask: np.ndarray) -> List[MarketData]:
+        """
+        columns로 만든 마스크에 해당하는 MarketData 목록.
+        예: hyqFetch.screen(hyqFetch.columns["dayNtlVlm"] > 1e6)
+        """
+        return self._query(lambda columns: columns.filter(mask))
+
+    def sort_by(
+        self,
+        field: str,
+        mask: Optional[np.ndarray] = None,
+        descending: bool = True,
+    ) -> List[MarketData]:
+        return self._query(lambda columns: columns.sort(field, mask, descending))
+
+    def top_k(
+        self,
+        field: str,
+        k: int,
+        mask: Optional[np.ndarray] = None,
+        descending: bool = True,
+    ) -> List[MarketData]:
+        """
+        예: 거래대금 100만 달러 이상 중 24시간 상승률 상위 10개
+            cols = hyqFetch.columns
+            hyqFetch.top_k("change_24h_pct", 10, cols["dayNtlVlm"] > 1e6)
+        """
+        return self._query(lambda columns: columns.top_k(field, k, mask, descending))
 
     def get_coin_list(self):
         return [spot_meta.coin for spot_meta in self.market_datas]
 
-    async def _fetcg_market_data(self):
+    @property
+    def version(self) -> int:
+        """
+        내용이 바뀐 build_data마다 1씩 증가한다.
+        """
+        return self._snapshot.version
+
+    def subscribe(self, callback: Callable[[MarketDataChange], Any]) -> None:
+        """
+        build_data로 내용이 바뀔 때마다 MarketDataChange로 호출될 콜백을 등록한다.
+        코루틴 함수도 등록할 수 있다.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[MarketDataChange], Any]) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    async def _fetcg_market_data(
+        self,
+    ) -> Tuple[Optional[List[dict]], Optional[str]]:
+        """
+        (market-data 원본 row 목록, ETag)를 가져온다. 이전 응답과 ETag가 같으면(304) row는 None.
+        ETag는 row를 적용한 뒤에 저장해야 하므로 여기서는 저장하지 않는다.
+        """
+        headers = {"If-None-Match": self._etag} if self._etag else None
         try:
-            response = await send_request("GET", f"{DATA_SERVER_URL}/data/market-data")
-            return [MarketData(**data) for data in response.data]
+            response = await send_request(
+                "GET",
+                f"{DATA_SERVER_URL}/data/market-data",
+                headers=headers,
+                coalesce=True,
+            )
         except NonJsonResponseIgnoredException as e:
             raise e
         except:
             raise MarketDataException("Failed to fetch market data")
+        if response.code == 304:
+            return None, self._etag
+        return response.data, response.etag
 
     async def build_data(self):
         try:
-            new_market_datas = await self._fetcg_market_data()
-            new_market_datas.append(self.USDC_DATA)  # USDC 데이터 추가
-            new_coin_by_Tname = {data.Tname: data for data in new_market_datas}
-            new_Tname_by_coin = {data.coin: data for data in new_market_datas}
-            new_coin_list = [spot_meta.coin for spot_meta in new_market_datas]
-            with self._lock:
-                self._market_datas = new_market_datas
-                self._coin_by_Tname = new_coin_by_Tname
-                self._Tname_by_coin = new_Tname_by_coin
-                self._coin_list = new_coin_list
+            rows, etag = await self._fetcg_market_data()
         except NonJsonResponseIgnoredException:
             logger.info("Non JSON response ignored")
             return
 
+        self.build_stats["builds"] += 1
+        if rows is None:
+            self.build_stats["not_modified"] += 1
+            return
+        # 파싱에 실패하면 ETag를 갱신하지 않아 다음 갱신에서 전체 응답을 다시 받는다.
+        await self._apply_rows(rows)
+        self._etag = etag
+
+    async def _apply_rows(
+        self,
+        rows: List[dict],
+        version: Optional[int] = None,
+        built_at: Optional[float] = None,
+        columns_array: Optional[np.ndarray] = None,
+    ) -> None:
+        change = self._swap_rows(rows, version, built_at, columns_array)
+        if change is not None:
+            self._persist_warm_start()
+            await self._publish(change)
+
+    def _swap_rows(
+        self,
+        rows: List[dict],
+        version: Optional[int] = None,
+        built_at: Optional[float] = None,
+        columns_array: Optional[np.ndarray] = None,
+        stale: bool = False,
+    ) -> Optional[MarketDataChange]:
+        """
+        rows로 새 스냅샷을 만들어 교체한다. 내용이 바뀌지 않았으면 None.
+        """
+        # row 단위로 이전 응답과 비교해 바뀐 코인만 다시 파싱한다.
+        # (orjson으로 디코딩한 dict 비교는 MarketData 생성보다 훨씬 싸다)
+        prev = self._snapshot
+        prev_rows = prev.rows_by_coin
+        prev_by_coin = prev.Tname_by_coin
+        change = MarketDataChange(
+            version=prev.version + 1 if version is None else version
+        )
+        new_rows_by_coin: Dict[str, dict] = {}
+        new_market_datas: List[MarketData] = []
+        try:
+            for row in rows:
+                coin = row["coin"]
+                new_rows_by_coin[coin] = row
+                prev_data = prev_by_coin.get(coin)
+                if prev_data is not None and prev_rows.get(coin) == row:
+                    new_market_datas.append(prev_data)
+                    continue
+                new_market_datas.append(MarketData(**row))
+                (change.updated if coin in prev_rows else change.added).append(coin)
+        except Exception:
+            raise MarketDataException("Failed to fetch market data")
+        change.removed = [coin for coin in prev_rows if coin not in new_rows_by_coin]
+
+        self.build_stats["rows_parsed"] += len(change.changed)
+        self.build_stats["rows_reused"] += len(rows) - len(change.changed)
+        if not change.changed and not change.removed and prev.market_datas:
+            self.build_stats["not_modified"] += 1
+            if prev.stale and not stale:
+                # warm start 데이터가 최신 데이터와 같음이 확인됨
+                self._snapshot = replace(prev, stale=False, built_at=time.time())
+            return None
+
+        new_market_datas.append(self.USDC_DATA)  # USDC 데이터 추가
+        # 새 스냅샷을 다 만든 뒤 참조 하나만 교체한다 (읽는 쪽은 락 불필요).
+        self._snapshot = MarketDataSnapshot.build(
+            change.version,
+            new_market_datas,
+            new_rows_by_coin,
+            built_at=built_at,
+            columns_array=columns_array,
+            stale=stale,
+        )
+        # 새 스냅샷에 없는 코인의 가격은 NaN이 된다.
+        self.prices.replace_all(
+            self._snapshot.coin_list, self._snapshot.columns["midPx"]
+        )
+        self.prices.set(self.USDC_DATA.coin, 1.0)  # 평가용 (USDC_DATA.midPx는 -1)
+        return change
+
+    @property
+    def is_stale(self) -> bool:
+        """
+        warm start로 올린 데이터를 아직 upstream 데이터로 갱신하지 못했으면 True.
+        """
+        return self._snapshot.stale
+
+    def load_warm_start(self) -> bool:
+        """
+        저장해 둔 스냅샷 파일이 있으면 stale 스냅샷으로 올린다.
+        WARM_START_MAX_AGE보다 오래된 파일은 무시한다.
+        """
+        try:
+            snapshot_file = read_snapshot_file(self._warm_start_path)
+            age = time.time() - snapshot_file.built_at
+            if age > WARM_START_MAX_AGE:
+                logger.info(f"market data warm start 건너뜀: age={age:.1f}s")
+                return False
+            self._swap_rows(
+                snapshot_file.payload,
+                version=snapshot_file.version,
+                built_at=snapshot_file.built_at,
+                columns_array=snapshot_file.array,
+                stale=True,
+            )
+        except FileNotFoundError:
+            return False
+        except Exception:
+            logger.warning(
+                f"market data warm start 실패: {self._warm_start_path}", exc_info=True
+            )
+            return False
+        logger.info(
+            f"market data warm start: version={snapshot_file.version}, age={age:.1f}s"
+        )
+        return True
+
+    def _persist_warm_start(self) -> None:
+        snapshot = self._snapshot
+        if (
+            not self._warm_start_path
+            or snapshot.stale
+            or time.time() - self._persisted_at < WARM_START_PERSIST_INTERVAL
+        ):
+            return
+        try:
+            write_snapshot_file(
+                self._warm_start_path,
+                snapshot.version,
+                snapshot.built_at,
+                self._export_rows(snapshot),
+                snapshot.columns.array,
+            )
+            self._persisted_at = time.time()
+        except OSError:
+            logger.warning("market data warm start 저장 실패", exc_info=True)
+
+    @staticmethod
+    def _export_rows(snapshot: MarketDataSnapshot) -> List[dict]:
+        """
+        파일(warm start/공유 스냅샷)로 내보낼 row 목록.
+
+        rows_by_coin은 delta 비교용 upstream 원본이라 apply_mid_prices로 바꾼 가격이 없다.
+        columns와 다른 가격은 columns 값으로 바꾼 복사본을 내보내서, 파일을 읽는 쪽의
+        MarketData와 columns가 같은 가격을 갖게 한다.
+        """
+        row_of = snapshot.columns.row_of
+        mid, mark = snapshot.columns["midPx"], snapshot.columns["markPx"]
+        rows: List[dict] = []
+        for coin, row in snapshot.rows_by_coin.items():
+            i = row_of[coin]
+            if (not np.isnan(mid[i]) and row.get("midPx") != mid[i]) or (
+                not np.isnan(mark[i]) and row.get("markPx") != mark[i]
+            ):
+                row = {**row, "midPx": float(mid[i]), "markPx": float(mark[i])}
+            rows.append(row)
+        return rows
+
+    def apply_mid_prices(
+        self, mids: Dict[str, Any], update_mark: bool = False
+    ) -> int:
+        """
+        allMids 형식({coin: price})의 가격으로 midPx(update_mark면 markPx도)를 바꾼 새 스냅샷으로
+        교체한다. 전체 build_data 사이에 가격만 최신으로 유지하는 용도이며,
+        갱신한 코인 수를 반환한다.
+
+        가격이 바뀐 MarketData는 model_copy로 새로 만들고 columns도 복사해서 바꾸므로,
+        이전 스냅샷을 들고 있는 쪽은 계속 이전 가격(객체와 columns 모두)을 본다.
+        markPx는 거래소 mark 가격이므로 기본으로는 바꾸지 않는다.
+        """
+        snapshot = self._snapshot
+        if snapshot.columns is None:
+            return 0
+        by_coin = snapshot.Tname_by_coin
+        row_of = snapshot.columns.row_of
+        fields = ("midPx", "markPx") if update_mark else ("midPx",)
+        market_datas = list(snapshot.market_datas)
+        coins: List[str] = []
+        rows: List[int] = []
+        prices: List[float] = []
+        for coin, price in mids.items():
+            data = by_coin.get(coin)
+            if data is None or data is self.USDC_DATA:
+                continue
+            try:
+                price = float(price)
+            except (TypeError, ValueError):
+                continue
+            row = row_of[coin]
+            market_datas[row] = data.model_copy(
+                update={field: price for field in fields}
+            )
+            coins.append(coin)
+            rows.append(row)
+            prices.append(price)
+        if not rows:
+            return 0
+
+        columns = snapshot.columns.patched(fields, rows, prices)
+        self._snapshot = replace(
+            MarketDataSnapshot.build(
+                snapshot.version,
+                market_datas,
+                snapshot.rows_by_coin,
+                built_at=snapshot.built_at,
+                columns_array=columns.array,
+                stale=snapshot.stale,
+            ),
+            prices_at=time.time(),
+        )
+        self.prices.update_many(coins, prices)
+        self.build_stats["price_updates"] += 1
+        return len(rows)
+
+    def enable_shared(self, mode: str, path: str) -> None:
+        """
+        worker 간 스냅샷 공유를 켠다. 이후 refresh()는 publisher면 upstream에서 받아
+        파일로 내보내고, reader면 파일이 바뀌었을 때만 읽어 들인다.
+        """
+        self._shared = SharedSnapshotChannel(path, mode)
+
+    async def refresh(self):
+        """
+        periodic_task가 호출하는 갱신 진입점.
+        """
+        shared = self._shared
+        if shared is None:
+            await self.build_data()
+        elif shared.is_publisher():
+            await self.build_data()
+            snapshot = self._snapshot
+            if snapshot.market_datas:
+                shared.publish(
+                    snapshot.version,
+                    snapshot.built_at,
+                    self._export_rows(snapshot),
+                    snapshot.columns.array,
+                )
+        else:
+            await self.load_shared()
+
+    async def load_shared(self) -> bool:
+        """
+        공유 스냅샷 파일이 바뀌었으면 적용하고 True를 반환한다.
+        숫자 컬럼은 파일을 map한 배열을 그대로 쓰고, 객체는 바뀐 row만 다시 만든다.
+        """
+        snapshot_file = self._shared.poll()
+        if snapshot_file is None or snapshot_file.version == self._snapshot.version:
+            return False
+        await self._apply_rows(
+            snapshot_file.payload,
+            version=snapshot_file.version,
+            built_at=snapshot_file.built_at,
+            columns_array=snapshot_file.array,
+        )
+        return True
+
+    def shared_stats(self) -> Optional[dict]:
+        return self._shared.stats() if self._shared else None
+
+    async def _publish(self, change: MarketDataChange) -> None:
+        for callback in list(self._subscribers):
+            try:
+                result = callback(change)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                logger.exception("market data change subscriber failed")
+
     def filter_by_Tname(self, Tname):
-        with self._lock:
-            data = self.coin_by_Tname.get(Tname)
-            if not data:
-                error_message = f"{Tname} is not in market data"
-                logger.error(error_message)
-                raise NoSuchTickerException(error_message)
-            return data
+        data = self._snapshot.coin_by_Tname.get(Tname)
+        if not data:
+            error_message = f"{Tname} is not in market data"
+            logger.error(error_message)
+            raise NoSuchTickerException(error_message)
+        return data
 
     def filter_by_coin(self, coin):
-        with self._lock:
-            data = self.Tname_by_coin.get(coin)
-            if not data:
-                logger.error(f"{coin} is not in market data")
-                raise MarketDataException(f"{coin} is not in market data")
-            return data
+        data = self._snapshot.Tname_by_coin.get(coin)
+        if not data:
+            logger.error(f"{coin} is not in market data")
+            raise MarketDataException(f"{coin} is not in market data")
+        return data
 
-    async def get_data_having_evm_contract(self) -> List[MarketData]:
-        async with self._async_lock:
-            now = datetime.now()
-            if (
-                self._evm_cache is None
-                or self._cache_timestamp is None
-                or now - self._cache_timestamp > self._cache_ttl
-            ):
-                # 실제 필터링 로직 (market_datas는 동기/비동기 혼용 주의)
-                self._evm_cache = [d for d in self._market_datas if d.evmContract]
-                self._cache_timestamp = now
+    def filter_by_sector(self, sector: str) -> List[MarketData]:
+        return self._snapshot.by_sector.get(sector, [])
+
+    def filter_by_token_id(self, token_id: str) -> MarketData:
+        data = self._snapshot.by_token_id.get(token_id)
+        if not data:
+            logger.error(f"tokenId {token_id} is not in market data")
+            raise MarketDataException(f"tokenId {token_id} is not in market data")
+        return data
 
-            return self._evm_cache
+    def filter_by_token_index(self, index: int) -> MarketData:
+        data = self._snapshot.by_token_index.get(index)
+        if not data:
+            logger.error(f"token index {index} is not in market data")
+            raise MarketDataException(f"token index {index} is not in market data")
+        return data
+
+    def filter_by_evm_address(self, address: str) -> MarketData:
+        data = self._snapshot.by_evm_address.get(address.lower())
+        if not data:
+            logger.error(f"evm address {address} is not in market data")
+            raise MarketDataException(f"evm address {address} is not in market data")
+        return data
+
+    def find_by_name(self, name: str) -> List[MarketData]:
+        """
+        Tname 또는 fullName이 name과 같은(대소문자 무시) MarketData 목록.
+        """
+        return self._snapshot.name_index.exact(name)
+
+    def search(self, prefix: str, limit: int = 20) -> List[MarketData]:
+        """
+        Tname 또는 fullName이 prefix로 시작하는(대소문자 무시) MarketData 목록. 자동완성용.
+        """
+        return self._snapshot.name_index.search(prefix, limit)
+
+    @property
+    def evm_market_datas(self) -> List[MarketData]:
+        """
+        evmContract가 있는 MarketData 목록 (스냅샷과 함께 갱신).
+        """
+        return self._snapshot.evm_market_datas
+
+    async def get_data_having_evm_contract(self) -> List[MarketData]:
+        return self._snapshot.evm_market_datas
 
 
 hyqFetch = HyqFetch()
+memory_profiler.register_cache(
+    "HyqFetch", lambda: (hyqFetch.snapshot, hyqFetch.prices)
+)
 
 
 async def periodic_task(interval):
     while True:
         try:
-            await hyqFetch.build_data()
+            await hyqFetch.refresh()
         except Exception as e:
             logger.exception(f"market data fetch failed")
         await asyncio.sleep(interval)
@@ -0,0 +1,66 @@
+from hypurrquant_fastapi_core.api.market_data import hyqFetch
+from hypurrquant_fastapi_core.api.json_codec import decode_json
+from hypurrquant_fastapi_core.constant.kafka import DataKafkaTopic, get_topic
+from hypurrquant_fastapi_core.constant.redis import DataRedisKey
+from hypurrquant_fastapi_core.logging_config import configure_logging
+from hypurrquant_fastapi_core.messaging.client import AsyncMessagingConsumer
+from hypurrquant_fastapi_core.messaging.core import BaseConsumer
+from hypurrquant_fastapi_core.utils.redis_config import redis_client
+from typing import Any, Dict, Optional
+import asyncio
+
+logger = configure_logging(__name__)
+
+
+def extract_mids(data: Any) -> Dict[str, Any]:
+    """
+    {coin: price} 또는 {"mids": {coin: price}} 형태의 메시지에서 가격 dict를 꺼낸다.
+    """
+    if isinstance(data, dict):
+        mids = data.get("mids", data)
+        if isinstance(mids, dict):
+            return mids
+    return {}
+
+
+class SpotMidPriceConsumer(BaseConsumer):
+    """
+    fetch 서버가 발행하는 SPOT_MARKET_DATA_MID_PRICE 이벤트로 hyqFetch의 가격을 갱신한다.
+
+    큐/FIFO 토픽은 메시지 하나가 consumer 하나에만 전달되므로, worker마다 모든 가격을
+    받아야 하는 구성에서는 poll_all_mids(Redis ALL_MIDS)를 사용한다.
+    """
+
+    def __init__(self, consumer_size: int = 1, update_mark: bool = False):
+        BaseConsumer.__init__(
+            self,
+            get_topic(DataKafkaTopic.SPOT_MARKET_DATA_MID_PRICE.value),
+            consumer_size,
+        )
+        self.update_mark = update_mark
+
+    async def process(self, data: dict, consumer: AsyncMessagingConsumer):
+        hyqFetch.apply_mid_prices(extract_mids(data), self.update_mark)
+
+
+async def refresh_mids_from_redis(update_mark: bool = False) -> int:
+    """
+    Redis ALL_MIDS 값을 읽어 hyqFetch 가격을 한 번 갱신하고 갱신한 코인 수를 반환한다.
+    """
+    response: Optional[str] = await redis_client.get(DataRedisKey.ALL_MIDS.value)
+    if response is None:
+        return 0
+    return hyqFetch.apply_mid_prices(extract_mids(decode_json(response)), update_mark)
+
+
+async def poll_all_mids(interval: float = 1.0, update_mark: bool = False):
+    """
+    interval마다 Redis ALL_MIDS로 가격을 갱신한다. 가격은 이쪽에서 최신으로 유지되므로
+    periodic_task(전체 메타데이터 갱신)의 interval은 몇 분 단위로 늘려도 된다.
+    """
+    while True:
+        try:
+            await refresh_mids_from_redis(update_mark)
+        except Exception:
+            logger.exception("all mids refresh failed")
+        await asyncio.sleep(interval)
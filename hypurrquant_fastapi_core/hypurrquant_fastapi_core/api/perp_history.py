@@ -0,0 +1,146 @@
+from hypurrquant_fastapi_core.api.columnar import ColumnarSnapshot
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+import warnings
+
+# refresh마다 기록하는 perp 필드
+HISTORY_FIELDS: Sequence[str] = ("funding", "openInterest", "premium")
+
+
+class PerpHistory:
+    """
+    perp 자산별 필드 값을 최근 window번의 refresh만큼 보관하는 링 버퍼.
+
+    - 필드마다 (자산 slot, window) float64 배열 하나. append는 열 하나를 쓰는 O(자산 수).
+    - mean/std/zscore/delta는 전체 자산에 대해 numpy 연산 한 번으로 계산하고
+      names 순서(slot 순서)의 배열을 반환한다. 자산별 dict가 필요하면 as_dict를 쓴다.
+    - 어떤 refresh에 없던 자산의 값은 NaN이며, 통계에서는 NaN을 제외한다.
+
+    slot은 한 번 배정되면 바뀌지 않는다. 이벤트 루프 하나에서만 갱신한다고 가정한다.
+    """
+
+    def __init__(
+        self,
+        window: int = 720,
+        fields: Sequence[str] = HISTORY_FIELDS,
+        capacity: int = 256,
+    ):
+        self.window = window
+        self.fields = tuple(fields)
+        self._values: Dict[str, np.ndarray] = {
+            name: np.full((capacity, window), np.nan) for name in self.fields
+        }
+        self._times = np.full(window, np.nan)  # 각 열의 built_at
+        self._slot_of: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._head = 0  # 다음에 쓸 열
+        self.count = 0  # 채워진 열 수 (최대 window)
+        self.version = 0  # 마지막으로 append한 스냅샷 version
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def _slot(self, name: str) -> int:
+        slot = self._slot_of.get(name)
+        if slot is None:
+            slot = len(self._names)
+            capacity = len(self._values[self.fields[0]])
+            if slot >= capacity:
+                for field, values in self._values.items():
+                    grown = np.full((capacity * 2, self.window), np.nan)
+                    grown[:capacity] = values
+                    self._values[field] = grown
+            self._slot_of[name] = slot
+            self._names.append(name)
+        return slot
+
+    def append(
+        self,
+        columns: ColumnarSnapshot,
+        built_at: float,
+        version: Optional[int] = None,
+    ) -> None:
+        """
+        스냅샷 columns 한 번을 새 열로 기록한다 (가장 오래된 열을 덮어씀).
+        """
+        slots = np.fromiter(
+            (self._slot(name) for name in columns.keys), np.intp, len(columns)
+        )
+        head = self._head
+        for field, values in self._values.items():
+            values[:, head] = np.nan
+            values[slots, head] = columns[field]
+        self._times[head] = built_at
+        self._head = (head + 1) % self.window
+        self.count = min(self.count + 1, self.window)
+        if version is not None:
+            self.version = version
+
+    def _columns(self, n: int) -> np.ndarray:
+        # 최근 n개 열의 인덱스 (오래된 것 → 최신)
+        n = min(n, self.count)
+        return (self._head - n + np.arange(n)) % self.window
+
+    def series(self, field: str, n: Optional[int] = None) -> np.ndarray:
+        """
+        최근 n번(기본: 전체) 값. shape은 (len(names), n)이고 열은 오래된 것 → 최신 순서.
+        """
+        return self._values[field][: len(self._names), self._columns(n or self.window)]
+
+    def times(self, n: Optional[int] = None) -> np.ndarray:
+        return self._times[self._columns(n or self.window)]
+
+    def latest(self, field: str) -> np.ndarray:
+        return self.series(field, 1)[:, -1] if self.count else self._empty()
+
+    def mean(self, field: str, n: int) -> np.ndarray:
+        return self._reduce(np.nanmean, field, n)
+
+    def std(self, field: str, n: int) -> np.ndarray:
+        return self._reduce(np.nanstd, field, n)
+
+    def zscore(self, field: str, n: int) -> np.ndarray:
+        """
+        최신 값이 최근 n번(최신 포함) 평균에서 표준편차 몇 배만큼 떨어져 있는지.
+        값이 일정하면(평균 대비 표준편차가 부동소수점 오차 수준이면) NaN.
+        """
+        series = self.series(field, n)
+        if series.shape[1] == 0:
+            return self._empty()
+        with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # 모두 NaN인 행
+            mean = np.nanmean(series, axis=1)
+            std = np.nanstd(series, axis=1)
+            return np.where(
+                std > 1e-9 * np.abs(mean), (series[:, -1] - mean) / std, np.nan
+            )
+
+    def delta(self, field: str, n: int) -> np.ndarray:
+        """
+        최신 값 - n번 전 refresh 값. 기록이 n+1번보다 적으면 NaN.
+        """
+        if n >= self.count:
+            return self._empty()
+        series = self.series(field, n + 1)
+        return series[:, -1] - series[:, 0]
+
+    def as_dict(self, values: np.ndarray) -> Dict[str, float]:
+        """
+        names 순서의 결과 배열을 {name: 값}으로 바꾼다.
+        """
+        return {name: float(value) for name, value in zip(self._names, values)}
+
+    def _reduce(self, reducer, field: str, n: int) -> np.ndarray:
+        series = self.series(field, n)
+        if series.shape[1] == 0:
+            return self._empty()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # 모두 NaN인 행
+            return reducer(series, axis=1)
+
+    def _empty(self) -> np.ndarray:
+        return np.full(len(self._names), np.nan)
@@ -5,27 +5,196 @@ from hypurrquant_fastapi_core.constant.projects import HYPERLIQUID_API_URL
 from hypurrquant_fastapi_core.singleton import singleton
 from hypurrquant_fastapi_core.logging_config import configure_logging, coroutine_logging
 from hypurrquant_fastapi_core.api.async_http import send_request
+from hypurrquant_fastapi_core.api.columnar import ColumnarSnapshot, PERP_NUMERIC_FIELDS
+from hypurrquant_fastapi_core.api.perp_history import PerpHistory
+from hypurrquant_fastapi_core.api.price_table import PriceTable
+from hypurrquant_fastapi_core.api.shared_snapshot import (
+    default_warm_start_path,
+    read_snapshot_file,
+    write_snapshot_file,
+)
 from hypurrquant_fastapi_core.graceful_shutdown import GracefulShutdownMixin
+from hypurrquant_fastapi_core.utils.memory_profiler import memory_profiler
+from hypurrquant_fastapi_core.exception import PerpMarketDataException
+from dataclasses import dataclass, field
 
-from typing import Dict
-import tracemalloc
-
-tracemalloc.start()
+from typing import Callable, Dict, List, Optional
+import numpy as np
+import os
+import time
 
 logger = configure_logging(__name__)
 
+# warm start 파일 경로 (빈 문자열이면 사용하지 않음), 저장 주기/최대 나이는 market_data와 같은 설정을 쓴다.
+PERP_MARKET_DATA_WARM_START_PATH = os.getenv(
+    "PERP_MARKET_DATA_WARM_START_PATH", default_warm_start_path("perp_market_data.warm")
+)
+WARM_START_PERSIST_INTERVAL = float(os.getenv("WARM_START_PERSIST_INTERVAL", "60"))
+WARM_START_MAX_AGE = float(os.getenv("WARM_START_MAX_AGE", "900"))
+# funding/openInterest/premium 이력을 보관할 refresh 횟수 (1분 주기면 720 = 12시간)
+PERP_HISTORY_WINDOW = int(os.getenv("PERP_HISTORY_WINDOW", "720"))
+
+# 스냅샷을 만들 때 미리 정렬해 두는 필드 (내림차순)
+RANKED_FIELDS = ("dayNtlVlm", "openInterest", "funding")
+
+
+@dataclass(frozen=True)
+class PerpMarketDataSnapshot:
+    """
+    _build_data 한 번의 결과 (데이터 + 정렬 뷰 + 컬럼 뷰).
+
+    PerpMarketDataCache는 새 스냅샷을 만든 뒤 참조 하나만 교체하므로, 읽는 쪽은
+    스냅샷을 한 번 잡아서 쓰면 항상 같은 빌드의 데이터를 보게 된다.
+    내부 list/dict는 공유되므로 수정하면 안 된다.
+    """
+
+    version: int = 0
+    built_at: float = 0.0  # time.time()
+    stale: bool = False  # warm start 파일에서 올린 뒤 아직 갱신되지 않은 스냅샷
+    market_datas: Dict[str, PerpMarketData] = field(default_factory=dict)
+    records: List[PerpMarketData] = field(default_factory=list)  # market_datas 값 순서
+    columns: Optional[ColumnarSnapshot] = None  # records와 같은 행 순서
+    impact_pxs: Optional[np.ndarray] = None  # (행, [bid, ask]) impactPxs, 없으면 NaN
+
+    # RANKED_FIELDS별 내림차순 목록(NaN 제외)과 name → 순위(0부터)
+    rankings: Dict[str, List[PerpMarketData]] = field(default_factory=dict)
+    rank_of: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        version: int,
+        market_datas: Dict[str, PerpMarketData],
+        built_at: Optional[float] = None,
+        stale: bool = False,
+    ) -> "PerpMarketDataSnapshot":
+        records = list(market_datas.values())
+        columns = ColumnarSnapshot.from_records(records, PERP_NUMERIC_FIELDS, key="name")
+        impact_pxs = np.array(
+            [
+                data.impactPxs if data.impactPxs and len(data.impactPxs) == 2
+                else (np.nan, np.nan)
+                for data in records
+            ],
+            dtype=np.float64,
+        ).reshape(len(records), 2)
+        impact_pxs.flags.writeable = False
+        rankings = {}
+        rank_of = {}
+        for ranked_field in RANKED_FIELDS:
+            rows = columns.sort(ranked_field)
+            rankings[ranked_field] = [records[i] for i in rows]
+            rank_of[ranked_field] = {records[i].name: rank for rank, i in enumerate(rows)}
+        return cls(
+            version=version,
+            built_at=time.time() if built_at is None else built_at,
+            stale=stale,
+            market_datas=market_datas,
+            records=records,
+            columns=columns,
+            impact_pxs=impact_pxs,
+            rankings=rankings,
+            rank_of=rank_of,
+        )
+
 
 @singleton
 class PerpMarketDataCache(GracefulShutdownMixin):
     def __init__(self):
         super().__init__()
-        self.market_datas: Dict["str", PerpMarketData] = {}
+        self._snapshot = PerpMarketDataSnapshot()
+        # name → midPx 가격 테이블
+        self.prices = PriceTable()
+        # refresh마다 쌓는 funding/openInterest/premium 링 버퍼
+        self.history = PerpHistory(PERP_HISTORY_WINDOW)
+        self._warm_start_path = PERP_MARKET_DATA_WARM_START_PATH
+        self._persisted_at = 0.0
+        if self._warm_start_path:
+            self.load_warm_start()
+
+    @property
+    def snapshot(self) -> PerpMarketDataSnapshot:
+        """
+        현재 스냅샷. 여러 필드를 함께 읽을 때는 이것을 한 번 잡아서 쓴다.
+        """
+        return self._snapshot
+
+    @property
+    def market_datas(self) -> Dict[str, PerpMarketData]:
+        return self._snapshot.market_datas
+
+    @property
+    def columns(self) -> Optional[ColumnarSnapshot]:
+        return self._snapshot.columns
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    @property
+    def built_at(self) -> float:
+        return self._snapshot.built_at
+
+    @property
+    def stale(self) -> bool:
+        # warm start 데이터를 아직 갱신하지 못한 상태
+        return self._snapshot.stale
+
+    def ranked(self, field: str, limit: Optional[int] = None) -> List[PerpMarketData]:
+        """
+        field 내림차순 목록 (상위 limit개). RANKED_FIELDS는 미리 정렬해 둔 목록을 자른다.
+        예: perp_market_data_cache.ranked("openInterest", 10)
+        """
+        snapshot = self._snapshot
+        ranking = snapshot.rankings.get(field)
+        if ranking is None:
+            ranking = self._query(lambda columns: columns.sort(field), snapshot)
+        return ranking if limit is None else ranking[:limit]
+
+    def rank(self, name: str, field: str) -> Optional[int]:
+        """
+        RANKED_FIELDS 기준 name의 순위 (0부터). 값이 없거나 아직 빌드 전이면 None.
+        RANKED_FIELDS가 아닌 field는 ValueError (ranked로 정렬한 목록을 사용한다).
+        """
+        if field not in RANKED_FIELDS:
+            raise ValueError(f"rank는 {RANKED_FIELDS} 필드만 지원합니다: {field}")
+        return self._snapshot.rank_of.get(field, {}).get(name)
+
+    def _query(
+        self,
+        query: Callable[[ColumnarSnapshot], np.ndarray],
+        snapshot: Optional[PerpMarketDataSnapshot] = None,
+    ) -> List[PerpMarketData]:
+        # columns와 market_datas를 같은 스냅샷에서 읽는다.
+        snapshot = snapshot or self._snapshot
+        if snapshot.columns is None:
+            logger.error("Perp market data is empty")
+            raise PerpMarketDataException("Perp market data is empty")
+        records = snapshot.records
+        return [records[i] for i in query(snapshot.columns)]
+
+    def screen(self, mask: np.ndarray) -> List[PerpMarketData]:
+        """
+        columns로 만든 마스크에 해당하는 PerpMarketData 목록.
+        예: perp_market_data_cache.screen(perp_market_data_cache.columns["maxLeverage"] >= 20)
+        """
+        return self._query(lambda columns: columns.filter(mask))
+
+    def top_k(
+        self,
+        field: str,
+        k: int,
+        mask: Optional[np.ndarray] = None,
+        descending: bool = True,
+    ) -> List[PerpMarketData]:
+        return self._query(lambda columns: columns.top_k(field, k, mask, descending))
 
     @coroutine_logging
     async def _fetch_market_data(self):
         response = await send_request(
             "GET",
             f"{HYPERLIQUID_API_URL}/data/perp-market-data",
+            coalesce=True,
         )
 
         market_data = {}
@@ -35,10 +204,94 @@ class PerpMarketDataCache(GracefulShutdownMixin):
         return market_data
 
     async def _build_data(self):
-        self.market_datas = await self._fetch_market_data()
+        self._set_market_datas(await self._fetch_market_data(), time.time())
+        self._persist_warm_start()
+
+    def _set_market_datas(
+        self,
+        market_datas: Dict[str, PerpMarketData],
+        built_at: float,
+        version: Optional[int] = None,
+        stale: bool = False,
+    ) -> None:
+        snapshot = PerpMarketDataSnapshot.build(
+            self._snapshot.version + 1 if version is None else version,
+            market_datas,
+            built_at=built_at,
+            stale=stale,
+        )
+        self._snapshot = snapshot
+        # 새 스냅샷에 없는 자산의 가격은 NaN이 된다.
+        self.prices.replace_all(
+            list(market_datas),
+            [data.midPx for data in market_datas.values()],
+        )
+        # warm start 데이터는 이미 지난 시점의 값이므로 이력에 넣지 않는다.
+        if not stale:
+            self.history.append(snapshot.columns, built_at, snapshot.version)
+
+    def load_warm_start(self) -> bool:
+        """
+        저장해 둔 스냅샷 파일이 있으면 stale 상태로 올린다.
+        WARM_START_MAX_AGE보다 오래된 파일은 무시하고, 내용은 upstream 응답과 같이 검증한다.
+        """
+        try:
+            snapshot_file = read_snapshot_file(self._warm_start_path)
+            age = time.time() - snapshot_file.built_at
+            if age > WARM_START_MAX_AGE:
+                logger.info(f"perp market data warm start 건너뜀: age={age:.1f}s")
+                return False
+            market_datas = {
+                name: PerpMarketData(**value)
+                for name, value in snapshot_file.payload.items()
+            }
+        except FileNotFoundError:
+            return False
+        except Exception:
+            logger.warning(
+                f"perp market data warm start 실패: {self._warm_start_path}",
+                exc_info=True,
+            )
+            return False
+        self._set_market_datas(
+            market_datas,
+            snapshot_file.built_at,
+            version=snapshot_file.version,
+            stale=True,
+        )
+        logger.info(
+            f"perp market data warm start: version={snapshot_file.version}, age={age:.1f}s"
+        )
+        return True
+
+    def _persist_warm_start(self) -> None:
+        if (
+            not self._warm_start_path
+            or time.time() - self._persisted_at < WARM_START_PERSIST_INTERVAL
+        ):
+            return
+        try:
+            snapshot = self._snapshot
+            write_snapshot_file(
+                self._warm_start_path,
+                snapshot.version,
+                snapshot.built_at,
+                {name: data.model_dump() for name, data in snapshot.market_datas.items()},
+            )
+            self._persisted_at = time.time()
+        except OSError:
+            logger.warning("perp market data warm start 저장 실패", exc_info=True)
 
     async def run_once(self):
         await perp_market_data_cache._build_data()
 
 
 perp_market_data_cache = PerpMarketDataCache()
+memory_profiler.register_cache(
+    "PerpMarketDataCache",
+    lambda: (
+        perp_market_data_cache.snapshot,
+        perp_market_data_cache.prices,
+        perp_market_data_cache.history,
+    ),
+)
@@ -0,0 +1,147 @@
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Union
+import numpy as np
+
+
+class PriceTable:
+    """
+    coin → slot 인덱스와 float64 가격 배열로 된 가격 테이블.
+
+    - 개별 갱신/조회는 dict 조회 한 번과 배열 접근 한 번(O(1)).
+    - allMids 형식 dict로 일괄 갱신할 수 있다.
+    - slots_for로 한 번 구한 slot 배열로 여러 코인 가격을 벡터로 읽어
+      포트폴리오 평가(수량 · 가격)를 numpy 연산 한 번으로 끝낼 수 있다.
+
+    slot은 한 번 배정되면 바뀌지 않는다. 모르는 코인과 마지막 replace_all에 없던 코인의
+    가격은 NaN이다.
+    """
+
+    def __init__(self, capacity: int = 512):
+        self._prices = np.full(capacity, np.nan)
+        self._slot_of: Dict[str, int] = {}
+        self._coins: List[str] = []
+        self.updates = 0
+
+    def __len__(self) -> int:
+        return len(self._coins)
+
+    def __contains__(self, coin: str) -> bool:
+        return coin in self._slot_of
+
+    @property
+    def coins(self) -> List[str]:
+        return list(self._coins)
+
+    def slot(self, coin: str) -> int:
+        """
+        coin의 slot. 없으면 새로 배정한다(배열이 차면 두 배로 늘림).
+        """
+        slot = self._slot_of.get(coin)
+        if slot is None:
+            slot = len(self._coins)
+            if slot >= len(self._prices):
+                grown = np.full(len(self._prices) * 2, np.nan)
+                grown[: len(self._prices)] = self._prices
+                self._prices = grown
+            self._slot_of[coin] = slot
+            self._coins.append(coin)
+        return slot
+
+    def set(self, coin: str, price: float) -> None:
+        self._prices[self.slot(coin)] = price
+        self.updates += 1
+
+    def get(self, coin: str, default: float = np.nan) -> float:
+        slot = self._slot_of.get(coin)
+        if slot is None:
+            return default
+        return float(self._prices[slot])
+
+    def update_many(
+        self, coins: Sequence[str], prices: Union[Sequence[float], np.ndarray]
+    ) -> None:
+        """
+        coins[i]의 가격을 prices[i]로 일괄 갱신한다.
+        """
+        slots = np.fromiter((self.slot(coin) for coin in coins), np.intp, len(coins))
+        self._prices[slots] = prices
+        self.updates += 1
+
+    def replace_all(
+        self, coins: Sequence[str], prices: Union[Sequence[float], np.ndarray]
+    ) -> None:
+        """
+        테이블 전체를 coins/prices로 바꾼다. coins에 없는 코인(상장 폐지 등)의 가격은 NaN이 되어
+        마지막 가격이 계속 쓰이지 않는다 (slot은 유지).
+        """
+        slots = np.fromiter((self.slot(coin) for coin in coins), np.intp, len(coins))
+        self._prices[:] = np.nan
+        self._prices[slots] = prices
+        self.updates += 1
+
+    def update_mids(self, mids: Mapping[str, Any]) -> int:
+        """
+        allMids 형식({coin: "가격"})으로 갱신하고 갱신한 코인 수를 반환한다.
+        숫자로 바꿀 수 없는 값은 건너뛴다.
+        """
+        coins: List[str] = []
+        prices: List[float] = []
+        for coin, price in mids.items():
+            try:
+                prices.append(float(price))
+            except (TypeError, ValueError):
+                continue
+            coins.append(coin)
+        if coins:
+            self.update_many(coins, prices)
+        return len(coins)
+
+    def slots_for(self, coins: Iterable[str]) -> np.ndarray:
+        """
+        coins의 slot 배열 (모르는 코인은 -1). 같은 포트폴리오를 반복 평가할 때 재사용한다.
+        """
+        slot_of = self._slot_of
+        return np.array([slot_of.get(coin, -1) for coin in coins], dtype=np.intp)
+
+    def prices_at(self, slots: np.ndarray) -> np.ndarray:
+        """
+        slot 배열의 가격 벡터 (slot -1은 NaN).
+        """
+        prices = self._prices[np.maximum(slots, 0)]
+        prices[slots < 0] = np.nan
+        return prices
+
+    def prices_for(self, coins: Iterable[str]) -> np.ndarray:
+        return self.prices_at(self.slots_for(coins))
+
+    def value(
+        self,
+        coins: Union[Iterable[str], np.ndarray],
+        sizes: Union[Sequence[float], np.ndarray],
+        strict: bool = False,
+    ) -> float:
+        """
+        Σ sizes[i] · price(coins[i]). coins 대신 slots_for 결과를 넘겨도 된다.
+        가격이 NaN인(모르거나 현재 스냅샷에 없는) 코인은 0으로 평가하고 건너뛴다.
+        strict=True면 수량이 있는 코인의 가격이 NaN일 때 ValueError를 낸다.
+        """
+        slots = coins if isinstance(coins, np.ndarray) else self.slots_for(coins)
+        prices = self.prices_at(slots)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        missing = np.isnan(prices) & (sizes != 0)
+        if strict and missing.any():
+            raise ValueError(f"가격이 없는 코인: {self._names_at(slots[missing])}")
+        return float(np.dot(np.nan_to_num(prices), sizes))
+
+    def missing(self, coins: Iterable[str]) -> List[str]:
+        """
+        coins 중 가격이 NaN인(모르거나 현재 스냅샷에 없는) 코인 목록.
+        """
+        coins = list(coins)
+        prices = self.prices_for(coins)
+        return [coin for coin, price in zip(coins, prices) if np.isnan(price)]
+
+    def _names_at(self, slots: np.ndarray) -> List[str]:
+        return [self._coins[slot] if slot >= 0 else "?" for slot in slots]
+
+    def as_dict(self) -> Dict[str, float]:
+        return {coin: float(self._prices[i]) for i, coin in enumerate(self._coins)}
@@ -0,0 +1,112 @@
+from hypurrquant_fastapi_core.logging_config import configure_logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+import contextvars
+import time
+
+logger = configure_logging(__name__)
+
+# /info 요청 type별 캐시 TTL(초). 여기에 없는 type은 캐싱하지 않는다.
+# 주문 직후 바로 반영되어야 하는 유저 상태(clearinghouseState 등)는 넣지 않는다.
+INFO_CACHE_TTLS: Dict[str, float] = {
+    "candleSnapshot": 5.0,
+    "allMids": 1.0,
+    "l2Book": 0.5,
+    "metaAndAssetCtxs": 2.0,
+    "spotMetaAndAssetCtxs": 2.0,
+    "meta": 60.0,
+    "spotMeta": 60.0,
+    "fundingHistory": 30.0,
+}
+
+# 현재 코루틴의 마지막 외부 요청이 캐시에서 응답되었는지 여부.
+# hl_rate_limited가 캐시 hit에는 rate limit weight를 기록하지 않도록 사용한다.
+served_from_cache = contextvars.ContextVar("served_from_cache", default=False)
+
+
+class ResponseCache:
+    """
+    TTL + LRU 응답 캐시.
+
+    - 엔트리 수(max_entries)와 응답 바이트 합계(max_bytes) 중 하나라도 넘으면
+      가장 오래 사용되지 않은 엔트리부터 제거한다.
+    - 만료된 엔트리는 조회 시점에 제거한다.
+    - 캐시된 값은 여러 호출자가 공유하므로 수정하면 안 된다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = dict(INFO_CACHE_TTLS if ttls is None else ttls)
+        # key -> (expires_at, size, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def ttl_for(self, payload: Optional[Any]) -> Optional[float]:
+        """
+        JSON payload의 "type"에 해당하는 TTL을 반환한다. 캐싱 대상이 아니면 None.
+        """
+        if not isinstance(payload, dict):
+            return None
+        request_type = payload.get("type")
+        if not isinstance(request_type, str):
+            return None
+        return self.ttls.get(request_type)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        expires_at, size, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: float, size: int) -> None:
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, size, value)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
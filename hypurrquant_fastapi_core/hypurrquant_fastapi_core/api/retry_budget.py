@@ -0,0 +1,262 @@
+from hypurrquant_fastapi_core.logging_config import configure_logging
+from email.utils import parsedate_to_datetime
+from functools import wraps
+from typing import Any, Callable, Coroutine, Dict, Optional, Tuple, Type
+from urllib.parse import urlsplit
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+)
+from tenacity.retry import retry_base
+from tenacity.wait import wait_base
+import aiohttp
+import datetime
+import random
+import time
+
+logger = configure_logging(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더 값(초 또는 HTTP-date)을 대기 시간(초)으로 변환한다.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+def retry_after_from_exception(exc: Optional[BaseException]) -> Optional[float]:
+    """
+    예외에 담긴 Retry-After 값을 찾는다.
+    - exc.retry_after 속성 (send_request의 비JSON 429/503 응답)
+    - aiohttp.ClientResponseError.headers의 Retry-After
+    """
+    if exc is None:
+        return None
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        return retry_after
+    if isinstance(exc, aiohttp.ClientResponseError) and exc.headers:
+        return parse_retry_after(exc.headers.get("Retry-After"))
+    return None
+
+
+class RetryBudget:
+    """
+    호스트 단위 재시도 예산.
+
+    최근 window_sec 동안의 첫 요청 수 대비 재시도 비율이 ratio를 넘지 않도록 제한한다.
+    트래픽이 적을 때도 재시도가 가능하도록 window당 min_retries 만큼은 항상 허용한다.
+    1초 단위 버킷을 사용하므로 요청 수와 무관하게 메모리는 일정하다.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        ratio: float = 0.2,
+        window_sec: int = 10,
+        min_retries: int = 10,
+    ):
+        self.host = host
+        self.ratio = ratio
+        self.window_sec = window_sec
+        self.min_retries = min_retries
+        # [버킷 초, 첫 요청 수, 재시도 수]
+        self._buckets = [[0, 0, 0] for _ in range(window_sec)]
+
+        # metrics
+        self.requests = 0  # 첫 시도 수
+        self.retries = 0  # 허용된 재시도 수
+        self.budget_exhausted = 0  # 예산 부족으로 포기한 재시도 수
+        self.retry_after_waits = 0  # Retry-After를 따른 대기 수
+        self.recovered = 0  # 재시도 끝에 성공한 요청 수
+        self.gave_up = 0  # 재시도 후에도 실패한 요청 수
+
+    def _bucket(self) -> list:
+        now = int(time.monotonic())
+        bucket = self._buckets[now % self.window_sec]
+        if bucket[0] != now:
+            bucket[0], bucket[1], bucket[2] = now, 0, 0
+        return bucket
+
+    def _window_totals(self) -> Tuple[int, int]:
+        cutoff = int(time.monotonic()) - self.window_sec
+        requests = retries = 0
+        for second, req, ret in self._buckets:
+            if second > cutoff:
+                requests += req
+                retries += ret
+        return requests, retries
+
+    def record_request(self) -> None:
+        self._bucket()[1] += 1
+        self.requests += 1
+
+    def try_acquire_retry(self) -> bool:
+        """
+        재시도 예산이 남아 있으면 재시도 1회를 기록하고 True를 반환한다.
+        """
+        requests, retries = self._window_totals()
+        if retries >= max(self.min_retries, self.ratio * requests):
+            self.budget_exhausted += 1
+            return False
+        self._bucket()[2] += 1
+        self.retries += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        window_requests, window_retries = self._window_totals()
+        return {
+            "host": self.host,
+            "ratio": self.ratio,
+            "window_sec": self.window_sec,
+            "window_requests": window_requests,
+            "window_retries": window_retries,
+            "requests": self.requests,
+            "retries": self.retries,
+            "budget_exhausted": self.budget_exhausted,
+            "retry_after_waits": self.retry_after_waits,
+            "recovered": self.recovered,
+            "gave_up": self.gave_up,
+        }
+
+
+class RetryBudgetRegistry:
+    def __init__(self, ratio: float = 0.2, window_sec: int = 10, min_retries: int = 10):
+        self.ratio = ratio
+        self.window_sec = window_sec
+        self.min_retries = min_retries
+        self._budgets: Dict[str, RetryBudget] = {}
+
+    def for_url(self, url: str) -> RetryBudget:
+        host = urlsplit(url).netloc
+        budget = self._budgets.get(host)
+        if budget is None:
+            budget = RetryBudget(host, self.ratio, self.window_sec, self.min_retries)
+            self._budgets[host] = budget
+        return budget
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {host: b.stats() for host, b in self._budgets.items()}
+
+
+retry_budgets = RetryBudgetRegistry()
+
+
+class retry_if_budget_allows(retry_base):
+    """
+    다음 시도가 남아 있을 때만 RetryBudget에서 재시도 1회를 가져간다.
+    (tenacity는 stop보다 retry를 먼저 확인하므로 마지막 시도에서는 예산을 쓰지 않게 막는다)
+    """
+
+    def __init__(self, budget: RetryBudget, max_attempts: int):
+        self.budget = budget
+        self.max_attempts = max_attempts
+
+    def __call__(self, retry_state) -> bool:
+        if retry_state.attempt_number >= self.max_attempts:
+            return False
+        return self.budget.try_acquire_retry()
+
+
+class wait_retry_after_or_full_jitter(wait_base):
+    """
+    Retry-After가 있으면 그 값을 따르고(최대 max_retry_after),
+    없으면 full jitter 지수 백오프: uniform(0, min(cap, base * 2^(attempt-1))).
+    """
+
+    def __init__(
+        self,
+        budget: RetryBudget,
+        base: float = 0.5,
+        cap: float = 8.0,
+        max_retry_after: float = 30.0,
+    ):
+        self.budget = budget
+        self.base = base
+        self.cap = cap
+        self.max_retry_after = max_retry_after
+
+    def __call__(self, retry_state) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = retry_after_from_exception(exc)
+        if retry_after is not None:
+            self.budget.retry_after_waits += 1
+            return min(retry_after, self.max_retry_after)
+        ceiling = min(self.cap, self.base * 2 ** (retry_state.attempt_number - 1))
+        return random.uniform(0, ceiling)
+
+
+def budgeted_retry(
+    max_attempts: int,
+    retry_on: Tuple[Type[BaseException], ...],
+    base: float = 0.5,
+    cap: float = 8.0,
+    on_retry: Optional[Callable[..., None]] = None,
+):
+    """
+    (method, url, ...) 시그니처의 async 요청 함수용 재시도 데코레이터.
+
+    - retry_on 예외에 대해 최대 max_attempts회 시도한다.
+    - 호스트별 RetryBudget이 허용할 때만 재시도한다.
+    - 대기는 Retry-After 우선, 없으면 full jitter 지수 백오프.
+    - 마지막 예외는 그대로 다시 던진다(reraise).
+    - on_retry가 주어지면 재시도 직전마다 원래 호출 인자로 호출한다(메트릭 기록용).
+    """
+
+    def decorator(
+        fn: Callable[..., Coroutine[Any, Any, Any]],
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            url = kwargs["url"] if "url" in kwargs else args[1]
+            budget = retry_budgets.for_url(url)
+            budget.record_request()
+            retrying = AsyncRetrying(
+                reraise=True,
+                stop=stop_after_attempt(max_attempts),
+                wait=wait_retry_after_or_full_jitter(budget, base, cap),
+                retry=(
+                    retry_if_exception_type(retry_on)
+                    & retry_if_budget_allows(budget, max_attempts)
+                ),
+            )
+            attempts = 0
+            try:
+                async for attempt in retrying:
+                    with attempt:
+                        attempts = attempt.retry_state.attempt_number
+                        if attempts > 1 and on_retry is not None:
+                            on_retry(*args, **kwargs)
+                        result = await fn(*args, **kwargs)
+            except BaseException:
+                if attempts > 1:
+                    budget.gave_up += 1
+                raise
+            if attempts > 1:
+                budget.recovered += 1
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def get_retry_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    호스트별 재시도 예산 사용량과 재시도 결과(recovered/gave_up 등)를 반환한다.
+    """
+    return retry_budgets.stats()
@@ -0,0 +1,61 @@
+from bisect import bisect_left
+from typing import Any, Dict, Generic, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class PrefixIndex(Generic[T]):
+    """
+    대소문자 무시 이름 검색 인덱스.
+
+    (이름, 값) 쌍을 소문자 이름 기준으로 정렬해 두고 bisect로 찾으므로
+    exact 조회는 O(1), prefix 검색은 O(log n + 결과 수)이다.
+    한 값에 이름이 여러 개(Tname, fullName 등)여도 된다.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, T]]):
+        pairs = sorted(
+            ((name.lower(), i, value) for i, (name, value) in enumerate(entries) if name),
+            key=lambda pair: (pair[0], pair[1]),
+        )
+        self._keys: List[str] = [key for key, _, _ in pairs]
+        self._values: List[T] = [value for _, _, value in pairs]
+        self._exact: Dict[str, List[T]] = {}
+        for key, _, value in pairs:
+            matches = self._exact.setdefault(key, [])
+            if not any(match is value for match in matches):
+                matches.append(value)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def exact(self, name: str) -> List[T]:
+        return self._exact.get(name.lower(), [])
+
+    def search(self, prefix: str, limit: int = 20) -> List[T]:
+        """
+        prefix로 시작하는 이름의 값 목록 (이름 오름차순, 중복 제거).
+        """
+        prefix = prefix.lower()
+        results: List[T] = []
+        seen: set = set()
+        for i in range(bisect_left(self._keys, prefix), len(self._keys)):
+            if not self._keys[i].startswith(prefix) or len(results) >= limit:
+                break
+            value = self._values[i]
+            if id(value) not in seen:
+                seen.add(id(value))
+                results.append(value)
+        return results
+
+
+def group_by(values: Iterable[T], key: Any) -> Dict[Any, List[T]]:
+    """
+    key(value)가 None이 아닌 값들을 key별 목록으로 묶는다.
+    """
+    groups: Dict[Any, List[T]] = {}
+    for value in values:
+        group = key(value)
+        if group is not None:
+            groups.setdefault(group, []).append(value)
+    return groups
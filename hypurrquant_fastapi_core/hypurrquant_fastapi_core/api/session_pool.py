@@ -0,0 +1,234 @@
+from hypurrquant_fastapi_core.logging_config import configure_logging
+from hypurrquant_fastapi_core.constant.projects import HYPERLIQUID_API_URL
+from hypurrquant_fastapi_core.api.http_metrics import Histogram
+import aiohttp
+from aiohttp import ClientSession, TCPConnector
+from dotenv import load_dotenv
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urlsplit
+import asyncio
+import os
+import threading
+import time
+
+load_dotenv()
+
+logger = configure_logging(__name__)
+
+# async_http는 market_data보다 먼저 import되므로 .env를 여기서도 읽어야 한다.
+DATA_SERVER_URL = os.getenv("BASE_URL")
+
+
+@dataclass(frozen=True)
+class SessionPoolConfig:
+    """
+    base URL 단위 커넥션 풀 설정.
+    """
+
+    limit: int = 100  # 풀 전체 최대 동시 커넥션
+    limit_per_host: int = 50  # 호스트당 최대
+    keepalive_timeout: float = 30.0  # 유휴 커넥션 유지 시간(초)
+    ttl_dns_cache: Optional[int] = 300  # DNS 캐시 TTL(초), None이면 무기한
+    connect_timeout: Optional[float] = None  # 커넥션 수립 타임아웃(초)
+    sock_read_timeout: Optional[float] = None  # 소켓 read 타임아웃(초)
+
+
+# 내부 데이터 서버: 호출 수가 적고 지연에 민감하므로 빠른 connect 실패
+INTERNAL_POOL_CONFIG = SessionPoolConfig(
+    limit=100,
+    limit_per_host=100,
+    keepalive_timeout=60.0,
+    ttl_dns_cache=60,
+    connect_timeout=3.0,
+)
+
+# Hyperliquid /info: 대량 호출이 몰리는 외부 API
+EXTERNAL_POOL_CONFIG = SessionPoolConfig(
+    limit=100,
+    limit_per_host=100,
+    keepalive_timeout=30.0,
+    ttl_dns_cache=300,
+    connect_timeout=5.0,
+)
+
+DEFAULT_POOL_CONFIG = SessionPoolConfig()
+
+
+class SessionPool:
+    """
+    하나의 base URL이 전용으로 사용하는 ClientSession + 동시성 게이트.
+
+    - connector limit과 같은 크기의 세마포어로 커넥션 획득을 감싸서
+      사용 중/대기 중 요청 수와 획득 대기 시간을 측정한다.
+    - 세션은 이벤트 루프 안에서 처음 사용할 때 생성된다.
+    """
+
+    def __init__(self, base_url: str, config: SessionPoolConfig):
+        self.base_url = base_url
+        self.config = config
+        self._session: Optional[ClientSession] = None
+        self._semaphore = asyncio.Semaphore(config.limit)
+        self._in_use = 0
+        self._queued = 0
+        self._acquired_total = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self.wait_histogram = Histogram()
+
+    def get_session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            connector = TCPConnector(
+                limit=self.config.limit,
+                limit_per_host=self.config.limit_per_host,
+                keepalive_timeout=self.config.keepalive_timeout,
+                ttl_dns_cache=self.config.ttl_dns_cache,
+                use_dns_cache=True,
+                enable_cleanup_closed=True,  # 닫힌 커넥션 자동 정리
+            )
+            self._session = ClientSession(connector=connector)
+        return self._session
+
+    def timeout(self, total: float) -> aiohttp.ClientTimeout:
+        """
+        요청별 total 타임아웃에 풀 단위 connect/sock_read 타임아웃을 합친다.
+        """
+        return aiohttp.ClientTimeout(
+            total=total,
+            connect=self.config.connect_timeout,
+            sock_read=self.config.sock_read_timeout,
+        )
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[ClientSession]:
+        """
+        풀 슬롯을 하나 획득하고 세션을 돌려준다.
+        `async with` 블록이 끝날 때(응답 본문까지 읽은 뒤) 슬롯이 반환된다.
+        """
+        self._queued += 1
+        started = time.perf_counter()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+        waited = time.perf_counter() - started
+        self._acquired_total += 1
+        self._wait_time_total += waited
+        if waited > self._wait_time_max:
+            self._wait_time_max = waited
+        self.wait_histogram.observe(waited)
+
+        self._in_use += 1
+        try:
+            yield self.get_session()
+        finally:
+            self._in_use -= 1
+            self._semaphore.release()
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def stats(self) -> Dict[str, Any]:
+        acquired = self._acquired_total
+        return {
+            "base_url": self.base_url,
+            "config": asdict(self.config),
+            "in_use": self._in_use,
+            "queued": self._queued,
+            "acquired_total": acquired,
+            "wait_time_total": self._wait_time_total,
+            "wait_time_avg": self._wait_time_total / acquired if acquired else 0.0,
+            "wait_time_max": self._wait_time_max,
+            "wait_time": self.wait_histogram.snapshot(),
+        }
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class SessionPoolRegistry:
+    """
+    base URL → SessionPool 레지스트리.
+
+    등록된 base URL 중 가장 긴 prefix가 일치하는 풀을 사용하고,
+    일치하는 것이 없으면 요청 URL의 origin(scheme://host:port) 단위로
+    기본 설정의 풀을 만들어 사용한다.
+    """
+
+    def __init__(self, default_config: SessionPoolConfig = DEFAULT_POOL_CONFIG):
+        self.default_config = default_config
+        self._pools: Dict[str, SessionPool] = {}
+        self._prefixes: List[str] = []  # 긴 prefix 우선
+        self._default_pool = SessionPool("*", default_config)
+        self._lock = threading.Lock()
+
+    def register(self, base_url: str, config: SessionPoolConfig) -> SessionPool:
+        """
+        base URL 전용 풀을 등록한다.
+        이미 세션이 열린 풀은 교체하지 않고 기존 풀을 그대로 반환한다.
+        """
+        base_url = base_url.rstrip("/")
+        with self._lock:
+            pool = self._pools.get(base_url)
+            if pool is not None and (
+                pool.config == config or pool._session is not None
+            ):
+                if pool.config != config:
+                    logger.warning(
+                        f"{base_url} 풀이 이미 사용 중이므로 새 설정을 무시합니다."
+                    )
+                return pool
+            pool = SessionPool(base_url, config)
+            self._pools[base_url] = pool
+            if base_url not in self._prefixes:
+                self._prefixes.append(base_url)
+                self._prefixes.sort(key=len, reverse=True)
+            return pool
+
+    def get_pool(self, url: str) -> SessionPool:
+        for prefix in self._prefixes:
+            if url.startswith(prefix):
+                return self._pools[prefix]
+
+        origin = _origin(url)
+        pool = self._pools.get(origin)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(origin)
+                if pool is None:
+                    pool = SessionPool(origin, self.default_config)
+                    self._pools[origin] = pool
+        return pool
+
+    def default_pool(self) -> SessionPool:
+        """URL 없이 세션을 요청하는 기존 호출부를 위한 공용 풀."""
+        return self._default_pool
+
+    def pools(self) -> List[SessionPool]:
+        return [self._default_pool, *self._pools.values()]
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [pool.stats() for pool in self.pools()]
+
+    async def close_all(self) -> None:
+        for pool in self.pools():
+            await pool.close()
+
+
+session_pools = SessionPoolRegistry()
+
+if DATA_SERVER_URL:
+    session_pools.register(DATA_SERVER_URL, INTERNAL_POOL_CONFIG)
+session_pools.register(HYPERLIQUID_API_URL, EXTERNAL_POOL_CONFIG)
+
+
+def get_pool_stats() -> List[Dict[str, Any]]:
+    """
+    모든 풀의 사용 중/대기 중 요청 수와 획득 대기 시간을 반환한다.
+    """
+    return session_pools.stats()
@@ -0,0 +1,217 @@
+from hypurrquant_fastapi_core.logging_config import configure_logging
+from hypurrquant_fastapi_core.api.json_codec import decode_json, encode_json
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+import fcntl
+import mmap
+import numpy as np
+import os
+import struct
+import tempfile
+
+logger = configure_logging(__name__)
+
+# 파일 형식: header | meta(JSON) | 8바이트 정렬 padding | 구조화 배열 raw bytes
+#   header = magic, version, built_at, meta 길이, 배열 길이(bytes)
+#   meta   = {"dtype": 배열 dtype descr, "count": 행 수, "payload": 임의 JSON}
+MAGIC = b"HYQSNAP1"
+_HEADER = struct.Struct("<8sQdQQ")
+
+SHARED_MODES = ("off", "auto", "publisher", "reader")
+
+
+def default_shared_path(filename: str) -> str:
+    """
+    사용자 전용 런타임 디렉터리($XDG_RUNTIME_DIR, 보통 tmpfs) 아래 hypurrquant/filename.
+    없으면 default_warm_start_path와 같은 캐시 디렉터리를 쓴다.
+    /dev/shm 같은 공용 디렉터리의 예측 가능한 이름은 다른 사용자가 미리 만들거나
+    symlink로 바꿔서 위조한 데이터를 모든 reader에게 읽힐 수 있다.
+    """
+    directory = os.getenv("XDG_RUNTIME_DIR")
+    if not directory or not os.path.isdir(directory):
+        return default_warm_start_path(filename)
+    return os.path.join(directory, "hypurrquant", filename)
+
+
+def default_warm_start_path(filename: str) -> str:
+    """
+    사용자 전용 캐시 디렉터리($XDG_CACHE_HOME 또는 ~/.cache) 아래 hypurrquant/filename.
+    누구나 쓸 수 있는 임시 디렉터리의 예측 가능한 이름은 다른 사용자가 미리 만들어 둘 수 있다.
+    """
+    directory = os.getenv("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(directory, "hypurrquant", filename)
+
+
+def _ensure_private_dir(path: str) -> str:
+    """
+    path가 들어갈 디렉터리를 0700으로 만들고 디렉터리 경로를 반환한다.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    return directory
+
+
+@dataclass
+class SnapshotFile:
+    version: int
+    built_at: float
+    payload: Any
+    array: Optional[np.ndarray]  # mmap 위의 읽기 전용 view (복사 없음)
+
+
+def write_snapshot_file(
+    path: str,
+    version: int,
+    built_at: float,
+    payload: Any,
+    array: Optional[np.ndarray] = None,
+) -> None:
+    """
+    임시 파일에 쓴 뒤 os.replace로 교체한다. 이미 파일을 map한 reader는
+    이전 inode를 계속 보므로 쓰는 도중의 내용을 읽는 일이 없다.
+    """
+    meta = {"payload": payload}
+    array_bytes = b""
+    if array is not None:
+        array = np.ascontiguousarray(array)
+        meta["dtype"] = array.dtype.descr
+        meta["count"] = len(array)
+        array_bytes = array.tobytes()
+    meta_bytes = encode_json(meta)
+    padding = b"\0" * (-(_HEADER.size + len(meta_bytes)) % 8)
+
+    # mkstemp는 O_EXCL로 새 파일(0600)을 만들므로 미리 만들어 둔 파일/symlink를 따라가지 않는다.
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f"{os.path.basename(path)}.",
+        suffix=".tmp",
+        dir=_ensure_private_dir(path),
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    MAGIC, version, built_at, len(meta_bytes), len(array_bytes)
+                )
+            )
+            f.write(meta_bytes)
+            f.write(padding)
+            f.write(array_bytes)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def read_snapshot_file(path: str) -> SnapshotFile:
+    """
+    파일을 읽기 전용으로 map한다. 배열은 mmap을 그대로 가리키는 view이며,
+    배열이 살아 있는 동안 mmap도 유지된다.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mm) < _HEADER.size:
+        raise ValueError(f"snapshot file is truncated: {path}")
+    magic, version, built_at, meta_len, array_len = _HEADER.unpack_from(mm, 0)
+    if magic != MAGIC:
+        raise ValueError(f"not a snapshot file: {path}")
+    meta_end = _HEADER.size + meta_len
+    meta = decode_json(mm[_HEADER.size : meta_end])
+
+    array = None
+    if "dtype" in meta:
+        offset = meta_end + (-meta_end % 8)
+        if offset + array_len > len(mm):
+            raise ValueError(f"snapshot file is truncated: {path}")
+        dtype = np.dtype([tuple(field) for field in meta["dtype"]])
+        array = np.frombuffer(mm, dtype=dtype, count=meta["count"], offset=offset)
+    return SnapshotFile(version, built_at, meta["payload"], array)
+
+
+class SharedSnapshotChannel:
+    """
+    여러 worker 프로세스가 스냅샷 파일 하나를 공유하기 위한 채널.
+
+    - publisher: upstream에서 데이터를 받아 publish()로 파일을 교체한다.
+    - reader: poll()로 파일이 바뀌었을 때만 새 스냅샷을 읽는다.
+    - auto: {path}.lock 파일의 flock을 잡은 프로세스 하나가 publisher가 되고,
+      나머지는 reader로 동작하다가 publisher가 죽으면 다음 호출에서 승계한다.
+    """
+
+    def __init__(self, path: str, mode: str = "auto"):
+        if mode not in SHARED_MODES or mode == "off":
+            raise ValueError(f"invalid shared snapshot mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self._lock_fd: Optional[int] = None
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._published_version: Optional[int] = None
+        self.published = 0
+        self.loaded = 0
+
+    def is_publisher(self) -> bool:
+        if self.mode == "publisher":
+            return True
+        if self.mode == "reader":
+            return False
+        if self._lock_fd is None:
+            _ensure_private_dir(self.path)
+            fd = os.open(
+                f"{self.path}.lock",
+                os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW,
+                0o600,
+            )
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                return False
+            self._lock_fd = fd  # 프로세스가 끝날 때까지 유지
+            logger.info(f"shared snapshot publisher: pid={os.getpid()} path={self.path}")
+        return True
+
+    def publish(
+        self,
+        version: int,
+        built_at: float,
+        payload: Any,
+        array: Optional[np.ndarray] = None,
+    ) -> bool:
+        """
+        version이 마지막으로 쓴 것과 다를 때만 파일을 교체한다.
+        """
+        if version == self._published_version:
+            return False
+        write_snapshot_file(self.path, version, built_at, payload, array)
+        self._published_version = version
+        self.published += 1
+        return True
+
+    def poll(self) -> Optional[SnapshotFile]:
+        """
+        마지막으로 읽은 뒤 파일이 교체되었으면 새 SnapshotFile, 아니면 None.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        file_id = (stat.st_ino, stat.st_mtime_ns)
+        if file_id == self._file_id:
+            return None
+        snapshot_file = read_snapshot_file(self.path)
+        self._file_id = file_id
+        self.loaded += 1
+        return snapshot_file
+
+    def stats(self) -> dict:
+        return {
+            "path": self.path,
+            "mode": self.mode,
+            "publisher": self._lock_fd is not None or self.mode == "publisher",
+            "published": self.published,
+            "loaded": self.loaded,
+        }
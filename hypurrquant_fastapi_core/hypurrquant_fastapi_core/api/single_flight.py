@@ -0,0 +1,99 @@
+from hypurrquant_fastapi_core.logging_config import configure_logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+import asyncio
+import json
+
+logger = configure_logging(__name__)
+
+# 키 계산에서 제외하는 헤더 (요청마다 달라지지만 응답에는 영향이 없음)
+_IGNORED_HEADERS = frozenset({"x-coroutine-id"})
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def make_request_key(
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, str]] = None,
+    data: Optional[Any] = None,
+    json_data: Optional[Any] = None,
+) -> Optional[Hashable]:
+    """
+    method, URL, 정규화된 params/JSON body로 요청 키를 만든다.
+    form data처럼 정규화할 수 없는 body가 있으면 None을 반환한다(병합 대상 아님).
+    """
+    if data is not None and not isinstance(data, (str, bytes)):
+        return None
+    canonical_headers = (
+        _canonical(
+            {
+                k.lower(): v
+                for k, v in headers.items()
+                if k.lower() not in _IGNORED_HEADERS
+            }
+        )
+        if headers
+        else ""
+    )
+    return (
+        method.upper(),
+        url,
+        canonical_headers,
+        _canonical(params) if params else "",
+        data,
+        _canonical(json_data) if json_data is not None else "",
+    )
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 요청을 하나의 upstream 호출로 합친다.
+
+    - 첫 호출자(leader)만 실제 호출을 수행하고, 그동안 들어온 호출자(follower)는
+      같은 결과(또는 같은 예외)를 공유한다. 결과 객체는 공유되므로 수정하면 안 된다.
+    - 실제 호출은 별도 태스크에서 실행되므로 일부 호출자가 취소되어도
+      나머지 호출자에게는 영향이 없다.
+    - 호출이 끝나면 키는 즉시 제거된다(결과를 캐싱하지 않음).
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._followers: Dict[Hashable, int] = {}
+        self.hits = 0  # 진행 중인 호출에 합류한 횟수
+        self.misses = 0  # 직접 upstream 호출을 수행한 횟수
+        self.coalesced = 0  # 두 명 이상이 공유한 upstream 호출 수
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.hits += 1
+            followers = self._followers.get(key, 0)
+            if followers == 0:
+                self.coalesced += 1
+            self._followers[key] = followers + 1
+            return await asyncio.shield(task)
+
+        self.misses += 1
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._on_done(key, t))
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._followers.pop(key, None)
+        # 모든 호출자가 취소된 경우에도 "exception was never retrieved" 경고를 막는다.
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }
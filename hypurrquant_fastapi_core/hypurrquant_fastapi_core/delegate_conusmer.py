@@ -10,7 +10,11 @@ from hypurrquant_fastapi_core.messaging.client import AsyncMessagingConsumer
 from hypurrquant_fastapi_core.constant.projects import HYPERLIQUID_API_URL
 from hypurrquant_fastapi_core.singleton import singleton
 from hypurrquant_fastapi_core.messaging.core import BaseConsumer
-from hypurrquant_fastapi_core.utils.redis_config import redis_client
+from hypurrquant_fastapi_core.utils.redis_config import redis_client_binary
+from hypurrquant_fastapi_core.api.candle_codec import (
+    CANDLE_CACHE_FORMAT,
+    encode_candles,
+)
 from hypurrquant_fastapi_core.constant.redis import DataRedisKey
 import time
 import asyncio
@@ -97,7 +101,11 @@ class DelegateResolver(BaseConsumer):
             key = DataRedisKey.CANDLE_BY_TICKER_INTERVAL.value.format(
                 ticker=ticker, interval=interval
             )
-            await redis_client.setex(key, ttl, json.dumps(response))
+            if CANDLE_CACHE_FORMAT == "binary":
+                value = encode_candles(response)
+            else:
+                value = json.dumps(response)
+            await redis_client_binary.setex(key, ttl, value)
             logger.debug(
                 f"[{self.TOPIC}] candle data for {ticker} with interval {interval} saved to Redis."
             )
@@ -48,3 +48,18 @@ class TooHighGasFeeException(CommonException):
             api_response (Optional[Any]): The APIResponse object.
         """
         super().__init__(message, 10000, api_response)
+
+
+class CircuitOpenException(CommonException):
+    """
+    호스트의 서킷 브레이커가 열려 있어 요청을 보내지 않은 경우 발생한다.
+    """
+
+    def __init__(self, message: str, api_response=None):
+        """
+        Args:
+            message (str): Error message from APIResponse.
+            code (int): Error code.
+            api_response (Optional[Any]): The APIResponse object.
+        """
+        super().__init__(message, 10001, api_response, 503)
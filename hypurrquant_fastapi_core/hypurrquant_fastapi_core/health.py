@@ -2,6 +2,7 @@ import asyncio
 import threading
 from fastapi import APIRouter, HTTPException
 from hypurrquant_fastapi_core.logging_config import configure_logging
+from hypurrquant_fastapi_core.api.circuit_breaker import get_circuit_states
 
 logger = configure_logging(__name__)
 health_router = APIRouter()
@@ -44,3 +45,11 @@ async def health_check_lb():
         if not is_healthy:
             raise HTTPException(status_code=503, detail="Service Unavailable")
     return {"status": "healthy"}
+
+
+@health_router.get("/health/circuits")
+async def health_check_circuits():
+    """
+    외부/내부 HTTP 호스트별 서킷 브레이커 상태.
+    """
+    return get_circuit_states()
@@ -0,0 +1,88 @@
+from fastapi import APIRouter, HTTPException
+from hypurrquant_fastapi_core.api.async_http import get_http_metrics
+from hypurrquant_fastapi_core.api.http_metrics import http_metrics
+from hypurrquant_fastapi_core.utils.memory_profiler import memory_profiler
+from hypurrquant_fastapi_core.logging_config import configure_logging
+
+from typing import Optional
+
+logger = configure_logging(__name__)
+metrics_router = APIRouter()
+
+
+# health_router 옆에 mount해서 사용: app.include_router(metrics_router)
+@metrics_router.get("/metrics/http")
+async def http_client_metrics():
+    """
+    HTTP 클라이언트(async_http) 계측 스냅샷.
+    """
+    return get_http_metrics()
+
+
+@metrics_router.get("/metrics/http/endpoints")
+async def http_client_endpoints():
+    return http_metrics.endpoints()
+
+
+@metrics_router.post("/metrics/http/reset")
+async def reset_http_client_metrics():
+    """
+    엔드포인트별 HTTP 메트릭을 초기화한다. (풀/서킷/재시도 예산 상태는 유지)
+    """
+    http_metrics.reset()
+    return {"status": "reset"}
+
+
+# ================================
+# 메모리 프로파일링 (tracemalloc은 start 호출 전까지 꺼져 있음)
+# ================================
+@metrics_router.get("/metrics/memory")
+async def memory_stats():
+    return {**memory_profiler.stats(), "caches": memory_profiler.cache_sizes()}
+
+
+@metrics_router.get("/metrics/memory/caches")
+async def memory_cache_sizes():
+    """
+    등록된 캐시(HyqFetch, PerpMarketDataCache 등)별 대략적인 메모리 크기(bytes).
+    """
+    return memory_profiler.cache_sizes()
+
+
+@metrics_router.post("/metrics/memory/start")
+async def start_memory_profiling(nframes: int = 1):
+    memory_profiler.start(nframes)
+    return memory_profiler.stats()
+
+
+@metrics_router.post("/metrics/memory/stop")
+async def stop_memory_profiling():
+    memory_profiler.stop()
+    return memory_profiler.stats()
+
+
+@metrics_router.post("/metrics/memory/snapshots")
+async def take_memory_snapshot(label: Optional[str] = None):
+    try:
+        return {"label": memory_profiler.take_snapshot(label)}
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@metrics_router.get("/metrics/memory/top")
+async def memory_top(label: Optional[str] = None, limit: int = 20):
+    try:
+        return memory_profiler.top(label, limit)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@metrics_router.get("/metrics/memory/diff")
+async def memory_diff(base: str, target: Optional[str] = None, limit: int = 20):
+    """
+    base 스냅샷 대비 target(기본: 마지막) 스냅샷에서 많이 늘어난 할당 위치.
+    """
+    try:
+        return memory_profiler.diff(base, target, limit)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
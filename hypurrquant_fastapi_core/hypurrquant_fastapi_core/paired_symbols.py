@@ -1,5 +1,11 @@
+from hypurrquant_fastapi_core.logging_config import configure_logging
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+import math
+import os
+
+logger = configure_logging(__name__)
 
 
 # 1) 마켓 타입 열거형 정의
@@ -10,12 +16,29 @@ class MarketType(Enum):
 
 # 2) 각 심볼의 설정 구조
 class SymbolConfig:
-    def __init__(self, display: str, internal: Dict[MarketType, str]):
+    def __init__(
+        self,
+        display: str,
+        internal: Dict[MarketType, str],
+        spot_coin: Optional[str] = None,
+    ):
         self.display = display
         self.internal = internal
+        self.spot_coin = spot_coin  # spot 주문용 coin (예: "@142"), live 데이터로 만든 경우에만
+
+    @property
+    def perp(self) -> str:
+        return self.internal[MarketType.PERP]
+
+    @property
+    def spot(self) -> str:
+        return self.internal[MarketType.SPOT]
+
+    def __repr__(self) -> str:
+        return f"SymbolConfig({self.display!r}, perp={self.perp!r}, spot={self.spot!r})"
 
 
-# 3) 전체 심볼 매핑 테이블
+# 3) 기본 심볼 매핑 테이블 (spot/perp 데이터를 아직 받지 못했을 때 사용)
 symbol_table: Dict[str, SymbolConfig] = {
     "BTC": SymbolConfig(
         display="BTC",
@@ -62,9 +85,167 @@ symbol_table: Dict[str, SymbolConfig] = {
 }
 
 
+# 직접 확인한 쌍 (기본 symbol_table 전체). 자동 매칭보다 우선하며 가격 확인 없이
+# 짝짓는다 (가격 차이가 크면 경고만 남긴다). HYPE/UFART처럼 규칙으로 찾을 수 없는 쌍도 여기에 둔다.
+MANUAL_OVERRIDES: Dict[str, Tuple[str, str]] = {
+    # display: (perp name, spot Tname)
+    display: (cfg.perp, cfg.spot)
+    for display, cfg in symbol_table.items()
+}
+
+# 자동 매칭 시 spot 가격(midPx, 없으면 markPx)과 perp oraclePx의 허용 괴리율
+PAIR_MAX_PRICE_DEVIATION = float(os.getenv("PAIR_MAX_PRICE_DEVIATION", "0.05"))
+
+
+@dataclass(frozen=True)
+class SymbolIndex:
+    """
+    SymbolResolver가 한 번 만든 매핑 (통째로 교체되므로 수정하면 안 된다).
+    """
+
+    versions: Tuple[int, int] = (0, 0)  # (hyqFetch.version, perp_market_data_cache.version)
+    by_display: Dict[str, SymbolConfig] = field(default_factory=dict)
+    by_spot: Dict[str, SymbolConfig] = field(default_factory=dict)  # spot Tname
+    by_spot_coin: Dict[str, SymbolConfig] = field(default_factory=dict)  # "@142"
+    by_perp: Dict[str, SymbolConfig] = field(default_factory=dict)
+
+    @classmethod
+    def from_configs(
+        cls, configs: List[SymbolConfig], versions: Tuple[int, int] = (0, 0)
+    ) -> "SymbolIndex":
+        return cls(
+            versions=versions,
+            by_display={cfg.display: cfg for cfg in configs},
+            by_spot={cfg.spot: cfg for cfg in configs},
+            by_spot_coin={cfg.spot_coin: cfg for cfg in configs if cfg.spot_coin},
+            by_perp={cfg.perp: cfg for cfg in configs},
+        )
+
+
+def _prices_match(
+    spot_px: Optional[float], perp_px: Optional[float], max_deviation: float
+) -> bool:
+    if not spot_px or not perp_px or math.isnan(spot_px) or math.isnan(perp_px):
+        return False
+    return abs(spot_px / perp_px - 1) <= max_deviation
+
+
+def derive_pairs(
+    spots: Dict[str, Tuple[str, Optional[float]]],
+    perps: Dict[str, Optional[float]],
+    overrides: Dict[str, Tuple[str, str]] = MANUAL_OVERRIDES,
+    max_deviation: float = PAIR_MAX_PRICE_DEVIATION,
+) -> List[SymbolConfig]:
+    """
+    spot Tname → (coin, 가격), perp 이름 → oraclePx로 spot↔perp 쌍을 만든다.
+
+    우선순위: overrides → U로 감싼 spot 토큰(BTC ↔ UBTC).
+    가격 확인은 새로 찾은 자동 매칭에만 적용해서, 두 가격이 max_deviation 안에 있을 때만
+    짝짓는다 (이름만 같은 다른 토큰 방지). overrides는 가격과 관계없이 짝짓는다.
+    spot 토큰 하나는 perp 하나에만 짝지어진다. display는 perp 이름이다.
+    """
+    configs: List[SymbolConfig] = []
+    paired_perps = set()
+    used_spots = set()
+
+    def pair(display: str, perp: str, spot: str) -> None:
+        configs.append(
+            SymbolConfig(
+                display=display,
+                internal={MarketType.PERP: perp, MarketType.SPOT: spot},
+                spot_coin=spots[spot][0],
+            )
+        )
+        paired_perps.add(perp)
+        used_spots.add(spot)
+
+    for display, (perp, spot) in overrides.items():
+        if perp not in perps or spot not in spots:
+            logger.debug(f"override {display} 건너뜀: {perp}/{spot} 상장되어 있지 않음")
+            continue
+        if not _prices_match(spots[spot][1], perps[perp], max_deviation):
+            logger.warning(
+                f"override {display}: {spot} 가격 {spots[spot][1]}과 "
+                f"{perp} oraclePx {perps[perp]}의 차이가 큼"
+            )
+        pair(display, perp, spot)
+
+    for perp, perp_px in perps.items():
+        spot = f"U{perp}"
+        if perp in paired_perps or spot not in spots or spot in used_spots:
+            continue
+        if _prices_match(spots[spot][1], perp_px, max_deviation):
+            pair(perp, perp, spot)
+        else:
+            logger.debug(f"{perp}/{spot} 가격 차이로 짝짓지 않음")
+    return configs
+
+
+class SymbolResolver:
+    """
+    hyqFetch(spot)와 perp_market_data_cache(perp) 스냅샷으로 만든 spot↔perp 심볼 매핑.
+
+    조회할 때 두 캐시의 version만 비교해서 바뀌었으면 매핑을 다시 만든다. 새 쌍이 상장되면
+    코드 수정 없이 다음 refresh부터 조회된다. 두 캐시 중 하나라도 비어 있으면 symbol_table을 쓰고,
+    live 데이터에서 짝짓지 못한 symbol_table 심볼도 get()에서는 항상 symbol_table 값으로 찾는다.
+    모든 조회는 dict 조회 한 번(O(1))이다.
+    """
+
+    def __init__(self, overrides: Dict[str, Tuple[str, str]] = MANUAL_OVERRIDES):
+        self.overrides = overrides
+        self._index = SymbolIndex.from_configs(list(symbol_table.values()))
+        self.rebuilds = 0
+
+    @property
+    def index(self) -> SymbolIndex:
+        # MarketType/SymbolConfig만 쓰는 쪽이 캐시 싱글턴(warm start 파일 I/O 등)을
+        # 만들지 않도록 처음 조회할 때 import한다.
+        from hypurrquant_fastapi_core.api.market_data import hyqFetch
+        from hypurrquant_fastapi_core.api.perp_market_data import (
+            perp_market_data_cache,
+        )
+
+        spot, perp = hyqFetch.snapshot, perp_market_data_cache.snapshot
+        versions = (spot.version, perp.version)
+        index = self._index
+        if versions != index.versions and spot.market_datas and perp.market_datas:
+            index = self._index = SymbolIndex.from_configs(
+                derive_pairs(
+                    {
+                        Tname: (data.coin, data.midPx or data.markPx)
+                        for Tname, data in spot.coin_by_Tname.items()
+                    },
+                    {name: data.oraclePx for name, data in perp.market_datas.items()},
+                    self.overrides,
+                ),
+                versions,
+            )
+            self.rebuilds += 1
+        return index
+
+    def get(self, display: str) -> SymbolConfig:
+        cfg = self.index.by_display.get(display) or symbol_table.get(display)
+        if not cfg:
+            raise KeyError(f"Unknown symbol: {display}")  # TODO 예외 정의 필요함
+        return cfg
+
+    def by_perp(self, perp: str) -> Optional[SymbolConfig]:
+        return self.index.by_perp.get(perp)
+
+    def by_spot(self, spot: str) -> Optional[SymbolConfig]:
+        """
+        spot Tname("UBTC") 또는 coin("@142")으로 찾는다.
+        """
+        index = self.index
+        return index.by_spot.get(spot) or index.by_spot_coin.get(spot)
+
+    def symbols(self) -> List[str]:
+        return list(self.index.by_display)
+
+
+symbol_resolver = SymbolResolver()
+
+
 # 4) 헬퍼 함수
 def get_symbol_config(user_sym: str) -> SymbolConfig:
-    cfg = symbol_table.get(user_sym)
-    if not cfg:
-        raise KeyError(f"Unknown symbol: {user_sym}")  # TODO 예외 정의 필요함
-    return cfg
+    return symbol_resolver.get(user_sym)
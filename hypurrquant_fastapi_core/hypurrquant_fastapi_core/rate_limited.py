@@ -1,3 +1,4 @@
+from hypurrquant_fastapi_core.api.response_cache import served_from_cache
 import time
 import asyncio
 from collections import deque
@@ -37,6 +38,38 @@ class AsyncRateLimiter:
             used = sum(w for _, w in self.history)
             return max(0, self.max_quota - used)
 
+    async def acquire(self, weight: float = 1, reserve: float = 0) -> None:
+        """
+        남은 허용량이 weight + reserve 이상이 될 때까지 기다린 뒤 weight를 미리 기록합니다.
+        동시에 여러 요청을 보내는 쪽에서 허용량을 초과하지 않도록 사용합니다.
+        """
+        if weight + reserve > self.max_quota:
+            raise ValueError(
+                f"weight({weight}) + reserve({reserve})가 max_quota({self.max_quota})보다 큽니다."
+            )
+        while True:
+            async with self._lock:
+                await self._cleanup()
+                used = sum(w for _, w in self.history)
+                if self.max_quota - used >= weight + reserve:
+                    self.history.append((time.monotonic(), weight))
+                    return
+                # 가장 오래된 기록이 윈도우 밖으로 나갈 때까지 대기
+                wait = self.history[0][0] + self.window - time.monotonic()
+            await asyncio.sleep(max(wait, 0.01))
+
+
+    async def release(self, weight: float = 1) -> None:
+        """
+        acquire로 미리 기록한 weight를 되돌립니다.
+        요청이 실제로 나가지 않은 경우(응답 캐시 hit 등)에 사용합니다.
+        """
+        async with self._lock:
+            for i in range(len(self.history) - 1, -1, -1):
+                if self.history[i][1] == weight:
+                    del self.history[i]
+                    return
+
 
 # 전역으로 하나만 생성
 _default_async_limiter = AsyncRateLimiter(max_quota=1200, window_sec=60)
@@ -48,6 +81,7 @@ def hl_rate_limited(
     """
     async 함수용 레이트 리밋 데코레이터.
     허용량 초과 시 RuntimeError 발생.
+    응답 캐시에서 응답된 호출은 weight를 기록하지 않는다.
     """
 
     def decorator(
@@ -55,11 +89,15 @@ def hl_rate_limited(
     ) -> Callable[..., Coroutine[Any, Any, Any]]:
         @wraps(fn)
         async def wrapper(*args, **kwargs):
+            token = served_from_cache.set(False)
             try:
                 result = await fn(*args, **kwargs)
                 return result
             finally:
-                await limiter.record(weight)
+                cached = served_from_cache.get()
+                served_from_cache.reset(token)
+                if not cached:
+                    await limiter.record(weight)
 
         return wrapper
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from typing import Any, Optional
 from hypurrquant_fastapi_core.logging_config import configure_logging
 from fastapi.responses import JSONResponse
@@ -16,6 +16,12 @@ class BaseResponse(BaseModel):
     data: Any
     error_message: Optional[str] = None
     message: Optional[str] = None
+    # 응답의 ETag 헤더 (조건부 요청용, 직렬화되지 않음)
+    _etag: Optional[str] = PrivateAttr(default=None)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self._etag
 
 
 # ================================
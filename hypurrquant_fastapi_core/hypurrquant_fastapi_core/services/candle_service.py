@@ -1,18 +1,25 @@
 from hypurrquant_fastapi_core.singleton import singleton
 from hypurrquant_fastapi_core.constant.redis import DataRedisKey
-from hypurrquant_fastapi_core.utils.redis_config import redis_client
+from hypurrquant_fastapi_core.utils.redis_config import redis_client_binary
+from hypurrquant_fastapi_core.api.json_codec import decode_json
+from hypurrquant_fastapi_core.api.candle_codec import (
+    CandleArrays,
+    decode_candles,
+    encode_candles,
+    is_binary_candles,
+    payload_to_frame,
+)
 from hypurrquant_fastapi_core.logging_config import configure_logging
 from hypurrquant_fastapi_core.exception import *
 import pandas as pd
-import json
 
 logger = configure_logging(__file__)
 
 
 @singleton
 class CandleService:
-    async def fetch_candles(self, ticker: str, interval: str) -> pd.DataFrame:
-        response = await redis_client.get(
+    async def _get_payload(self, ticker: str, interval: str) -> bytes:
+        response = await redis_client_binary.get(
             DataRedisKey.CANDLE_BY_TICKER_INTERVAL.value.format(
                 ticker=ticker, interval=interval
             )
@@ -21,30 +28,20 @@ class CandleService:
             raise CandleDataException(
                 message=f"{ticker}의 {interval} 캔들 데이터가 없습니다."
             )
+        return response
 
-        data = json.loads(response)
+    async def fetch_candles(self, ticker: str, interval: str) -> pd.DataFrame:
+        """
+        바이너리 포맷이면 배열을 그대로 DataFrame으로(OHLCV 블록 복사 1회), 이전 JSON 포맷이면 파싱해서 반환한다.
+        """
+        payload = await self._get_payload(ticker, interval)
+        return payload_to_frame(payload, ticker, interval)
 
-        df = pd.DataFrame(data)
-        df.rename(
-            columns={
-                "t": "time",
-                "o": "open",
-                "h": "high",
-                "l": "low",
-                "c": "close",
-                "v": "volume",
-            },
-            inplace=True,
-        )
-        df["time"] = pd.to_datetime(df["time"], unit="ms")
-        df.set_index("time", inplace=True)
-        df = df.astype(
-            {
-                "open": float,
-                "high": float,
-                "low": float,
-                "close": float,
-                "volume": float,
-            }
-        )
-        return df
+    async def fetch_candle_arrays(self, ticker: str, interval: str) -> CandleArrays:
+        """
+        pandas 없이 payload를 그대로 보는 읽기 전용 numpy 배열로 받는다. JSON 포맷이면 한 번 변환한다.
+        """
+        payload = await self._get_payload(ticker, interval)
+        if not is_binary_candles(payload):
+            payload = encode_candles(decode_json(payload))
+        return decode_candles(payload)
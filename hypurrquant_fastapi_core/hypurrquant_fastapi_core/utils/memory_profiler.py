@@ -0,0 +1,163 @@
+from hypurrquant_fastapi_core.logging_config import configure_logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+import os
+import sys
+import time
+import tracemalloc
+
+logger = configure_logging(__name__)
+
+
+def deep_sizeof(obj: Any, seen: Optional[set] = None) -> int:
+    """
+    컨테이너/pydantic 모델/numpy 배열을 따라가며 합산한 대략적인 메모리 크기(bytes).
+    같은 객체는 한 번만 센다.
+    """
+    if seen is None:
+        seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, np.ndarray):
+            # mmap 등 외부 버퍼를 보는 view는 배열 헤더만 센다.
+            total += sys.getsizeof(current) + (current.nbytes if current.base is None else 0)
+            continue
+        total += sys.getsizeof(current)
+        if isinstance(current, (str, bytes, int, float, bool, type(None))):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, "__dict__"):
+            stack.append(current.__dict__)
+        elif hasattr(current, "__slots__"):
+            stack.extend(
+                getattr(current, name)
+                for name in current.__slots__
+                if hasattr(current, name)
+            )
+    return total
+
+
+class MemoryProfiler:
+    """
+    필요할 때만 켜는 tracemalloc 래퍼.
+
+    - start()/stop(): tracing on/off (꺼져 있으면 할당 비용이 없다)
+    - take_snapshot(label): 스냅샷 저장 (최근 max_snapshots개 유지)
+    - top()/diff(): 할당 위치 상위 N개, 두 스냅샷 사이 증가분 상위 N개
+    - cache_sizes(): register_cache로 등록한 캐시별 메모리 크기
+    """
+
+    def __init__(self, max_snapshots: int = 8):
+        self.max_snapshots = max_snapshots
+        self._snapshots: "OrderedDict[str, tracemalloc.Snapshot]" = OrderedDict()
+        self._caches: Dict[str, Callable[[], Any]] = {}
+        self.started_at: Optional[float] = None
+
+    @property
+    def is_tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, nframes: int = 1) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(nframes)
+            self.started_at = time.time()
+            logger.info(f"tracemalloc started (nframes={nframes})")
+
+    def stop(self) -> None:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("tracemalloc stopped")
+        self.started_at = None
+        self._snapshots.clear()  # tracing을 끄면 이전 스냅샷과 비교할 수 없다
+
+    def take_snapshot(self, label: Optional[str] = None) -> str:
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not tracing; call start() first")
+        label = label or f"snapshot-{int(time.time() * 1000)}"
+        self._snapshots[label] = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        self._snapshots.move_to_end(label)
+        while len(self._snapshots) > self.max_snapshots:
+            self._snapshots.popitem(last=False)
+        return label
+
+    def snapshots(self) -> List[str]:
+        return list(self._snapshots)
+
+    def _snapshot(self, label: Optional[str]) -> tracemalloc.Snapshot:
+        if label is None:
+            if not self._snapshots:
+                raise KeyError("no snapshots taken")
+            return next(reversed(self._snapshots.values()))
+        return self._snapshots[label]
+
+    def top(
+        self, label: Optional[str] = None, limit: int = 20, key_type: str = "lineno"
+    ) -> List[Dict[str, Any]]:
+        """
+        스냅샷(기본: 마지막)의 할당 위치 상위 limit개.
+        """
+        stats = self._snapshot(label).statistics(key_type)[:limit]
+        return [
+            {"location": str(stat.traceback), "size": stat.size, "count": stat.count}
+            for stat in stats
+        ]
+
+    def diff(
+        self,
+        base: str,
+        target: Optional[str] = None,
+        limit: int = 20,
+        key_type: str = "lineno",
+    ) -> List[Dict[str, Any]]:
+        """
+        base → target(기본: 마지막) 사이 증가량이 큰 할당 위치 상위 limit개.
+        """
+        stats = self._snapshot(target).compare_to(self._snapshot(base), key_type)
+        return [
+            {
+                "location": str(stat.traceback),
+                "size": stat.size,
+                "size_diff": stat.size_diff,
+                "count": stat.count,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats[:limit]
+        ]
+
+    def register_cache(self, name: str, getter: Callable[[], Any]) -> None:
+        """
+        cache_sizes()에 포함할 캐시를 등록한다. getter는 측정할 객체를 반환한다.
+        """
+        self._caches[name] = getter
+
+    def cache_sizes(self) -> Dict[str, int]:
+        return {name: deep_sizeof(getter()) for name, getter in self._caches.items()}
+
+    def stats(self) -> Dict[str, Any]:
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "tracing": self.is_tracing,
+            "started_at": self.started_at,
+            "traced_current": current,
+            "traced_peak": peak,
+            "snapshots": self.snapshots(),
+        }
+
+
+memory_profiler = MemoryProfiler()
+
+# 누수를 조사할 때만 MEMORY_PROFILING=true로 프로세스 시작부터 tracing한다.
+if os.getenv("MEMORY_PROFILING", "false").lower() in ("1", "true", "yes"):
+    memory_profiler.start(int(os.getenv("MEMORY_PROFILING_FRAMES", "1")))
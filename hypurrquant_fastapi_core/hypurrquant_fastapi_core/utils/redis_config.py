@@ -17,3 +17,5 @@ if PROFILE == "prod":
 
 redis_client = aioredis.Redis(**common_kwargs)
 redis_client_sync = sync_redis.Redis(**common_kwargs)
+# 바이너리 값(캔들 등)용: 응답을 str로 decode하지 않고 bytes로 돌려준다.
+redis_client_binary = aioredis.Redis(**{**common_kwargs, "decode_responses": False})